@@ -15,18 +15,24 @@ setup(
         "PyGithub>=2.1.0",
         "arxiv>=2.0.0",
         "scholarly>=1.7.0",
-        "gitpython>=3.1.0",
         "docker>=6.1.0",
         "pyyaml>=6.0",
         "click>=8.1.0",
         "rich>=13.0.0",
-        "inquirer>=3.1.0",
         "python-dotenv>=1.0.0",
         "tqdm>=4.66.0",
+        "xxhash>=3.0.0",
+        "orjson>=3.9.0",
+        "zstandard>=0.21.0",
+        "nvidia-ml-py>=12.535.0",
+        "sortedcontainers>=2.4.0",
     ],
+    extras_require={
+        "hyperscan": ["hyperscan>=0.4.0"],
+    },
     entry_points={
         "console_scripts": [
-            "research-reproduce=research_reproducer.cli:main",
+            "research-reproduce=research_reproducer:run",
         ],
     },
     python_requires=">=3.8",
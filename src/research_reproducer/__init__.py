@@ -2,4 +2,28 @@
 Research Reproducer - A tool for automatically reproducing research papers
 """
 
+import sys
+
 __version__ = "0.1.0"
+
+
+def run():
+    """
+    Console script entry point
+
+    Answers --version and a bare ``gpu`` directly so they do not have to
+    import Click and the orchestrator; everything else is handed to the
+    Click CLI.
+    """
+    if sys.argv[1:] == ['--version']:
+        print(f"research-reproduce, version {__version__}")
+        return
+
+    if sys.argv[1:] == ['gpu']:
+        from rich.console import Console
+        from .gpu_utils import print_gpu_status
+        print_gpu_status(Console())
+        return
+
+    from .cli import main
+    main()
@@ -2,56 +2,324 @@
 Caching module for paper metadata and repository analysis
 """
 
+import copy
+import functools
 import json
 import hashlib
 import logging
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+# Cache files are zstd-compressed when zstandard is available. Plain JSON
+# files written by older versions are still read and migrated on access.
+LEGACY_SUFFIX = '.json'
+CACHE_SUFFIX = '.json.zst' if zstandard else LEGACY_SUFFIX
+CACHE_SUFFIXES = ('.json', '.json.zst')
+
+# Entries larger than this are parsed from a memory map instead of a copy
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _decode_json(raw, compressed: bool) -> Dict:
+    """Decode a cache payload from a bytes-like object"""
+    if compressed:
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _read_json(path: Path) -> Dict:
+    """Read a (possibly zstd-compressed) JSON cache file"""
+    compressed = path.name.endswith('.zst')
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return _decode_json(f.read(), compressed)
+
+        # Parse large entries straight out of the page cache
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _decode_json(view, compressed)
+
+
+def _write_json(path: Path, data: Dict):
+    """Write a JSON cache file, compressing it if the path ends in .zst"""
+    compress = path.name.endswith('.zst')
+
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if not compress:
+            option |= orjson.OPT_INDENT_2
+        raw = orjson.dumps(data, default=str, option=option)
+    else:
+        raw = json.dumps(data, indent=None if compress else 2, default=str).encode('utf-8')
+
+    if compress:
+        raw = zstandard.ZstdCompressor(level=3).compress(raw)
+
+    path.write_bytes(raw)
+
 
 class ReproducerCache:
     """Cache for paper metadata and analysis results"""
 
+    # In-memory layer on top of the disk cache
+    MEMORY_CACHE_SIZE = 512
+    MEMORY_CACHE_TTL = 3600  # seconds
+
+    # Worker threads for bulk lookups (disk reads are I/O bound)
+    MAX_BULK_WORKERS = 8
+
+    # Cache directories already created in this process
+    _initialized_dirs = set()
+
     def __init__(self, cache_dir: str = './.cache/research_reproducer'):
         """
         Args:
             cache_dir: Directory to store cache files
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.paper_cache_dir = self.cache_dir / 'papers'
         self.repo_cache_dir = self.cache_dir / 'repositories'
         self.analysis_cache_dir = self.cache_dir / 'analysis'
 
-        self.paper_cache_dir.mkdir(exist_ok=True)
-        self.repo_cache_dir.mkdir(exist_ok=True)
-        self.analysis_cache_dir.mkdir(exist_ok=True)
+        self._dirs = {
+            'papers': self.paper_cache_dir,
+            'repositories': self.repo_cache_dir,
+            'analysis': self.analysis_cache_dir,
+        }
+
+        if str(self.cache_dir) not in ReproducerCache._initialized_dirs:
+            self._create_dirs()
 
-    def _get_cache_key(self, identifier: str) -> str:
-        """Generate cache key from identifier"""
-        return hashlib.md5(identifier.encode()).hexdigest()
+        # Entry counts, kept up to date by set_*/clear_cache
+        try:
+            self._counts = {kind: self._count_entries(directory) for kind, directory in self._dirs.items()}
+        except FileNotFoundError:
+            # Removed after an earlier instance created it
+            self._create_dirs()
+            self._counts = {kind: 0 for kind in self._dirs}
+
+        self._memory = {kind: OrderedDict() for kind in self._dirs}
+        self._memory_lock = threading.Lock()
+
+    def _create_dirs(self):
+        """Create the cache subdirectories (parents=True also creates cache_dir)"""
+        for directory in self._dirs.values():
+            directory.mkdir(parents=True, exist_ok=True)
+        ReproducerCache._initialized_dirs.add(str(self.cache_dir))
+
+    @staticmethod
+    def _count_entries(directory: Path) -> int:
+        """Count cache files in a directory"""
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(CACHE_SUFFIXES))
+
+    @staticmethod
+    def _clear_entries(directory: Path):
+        """Delete all cache files in a directory"""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(CACHE_SUFFIXES):
+                    os.unlink(entry.path)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_cache_key(identifier: str) -> str:
+        """Generate cache key from identifier (memoized, the same IDs are hashed repeatedly)"""
+        if xxhash:
+            return xxhash.xxh3_64_hexdigest(identifier.encode('utf-8'))
+        return hashlib.md5(identifier.encode('utf-8')).hexdigest()
 
     def _is_cache_valid(self, cache_file: Path, max_age_days: int = 7) -> bool:
-        """Check if cache file exists and is not too old"""
-        if not cache_file.exists():
+        """Check if cache file exists and is not too old (based on its mtime)"""
+        try:
+            mtime = cache_file.stat().st_mtime
+        except FileNotFoundError:
             return False
 
+        return (time.time() - mtime) < max_age_days * 86400
+
+    def _memory_get(self, kind: str, cache_key: str) -> Optional[Dict]:
+        """
+        Get an entry from the in-memory cache
+
+        Returns a copy, like a disk read, so callers can modify it without
+        changing the cached entry.
+        """
+        with self._memory_lock:
+            entry = self._memory[kind].get(cache_key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.time() - stored_at >= self.MEMORY_CACHE_TTL:
+                del self._memory[kind][cache_key]
+                return None
+
+            self._memory[kind].move_to_end(cache_key)
+
+        return copy.deepcopy(value)
+
+    def _memory_set(self, kind: str, cache_key: str, value: Dict):
+        """Store a copy of an entry in the in-memory cache, evicting the oldest if full"""
+        value = copy.deepcopy(value)
+        with self._memory_lock:
+            memory = self._memory[kind]
+            memory[cache_key] = (time.time(), value)
+            memory.move_to_end(cache_key)
+
+            if len(memory) > self.MEMORY_CACHE_SIZE:
+                memory.popitem(last=False)
+
+    def _get_many(self, getter: Callable[[str], Optional[Dict]], identifiers: List[str]) -> Dict[str, Dict]:
+        """Run a get_* method for many identifiers in parallel, returning only hits"""
+        identifiers = list(dict.fromkeys(identifiers))
+        if not identifiers:
+            return {}
+
+        results = {}
+        max_workers = min(os.cpu_count() or 4, self.MAX_BULK_WORKERS, len(identifiers))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(getter, identifier): identifier for identifier in identifiers}
+            for future in as_completed(futures):
+                value = future.result()
+                if value is not None:
+                    results[futures[future]] = value
+
+        return results
+
+    def _get_entry(self, kind: str, identifier: str, field: str, max_age_days: int) -> Optional[Dict]:
+        """
+        Look up a cache entry, first in memory and then on disk
+
+        Args:
+            kind: Cache kind ('papers', 'repositories' or 'analysis')
+            identifier: Paper ID or repository URL
+            field: Key of the cached payload in the stored record
+            max_age_days: Maximum age of the disk entry
+
+        Returns:
+            Cached payload or None
+        """
+        cache_key = self._get_cache_key(identifier)
+        cached = self._memory_get(kind, cache_key)
+        if cached is not None:
+            return cached
+
+        cache_file = self._dirs[kind] / f"{cache_key}{CACHE_SUFFIX}"
+
+        if not self._is_cache_valid(cache_file, max_age_days=max_age_days):
+            migrated = self._migrate_legacy_entry(kind, cache_key)
+            if not migrated or not self._is_cache_valid(migrated, max_age_days=max_age_days):
+                return None
+            cache_file = migrated
+
         try:
-            with open(cache_file) as f:
-                data = json.load(f)
+            value = _read_json(cache_file)[field]
+            logger.info(f"Using cached {kind} entry for {identifier}")
+            self._memory_set(kind, cache_key, value)
+            return value
+        except Exception as e:
+            logger.warning(f"Failed to read cache: {e}")
 
-            cached_time = datetime.fromisoformat(data.get('cached_at', ''))
-            age = datetime.now() - cached_time
+        return None
 
-            return age < timedelta(days=max_age_days)
+    def _migrate_legacy_entry(self, kind: str, cache_key: str) -> Optional[Path]:
+        """
+        Rewrite a plain JSON entry from an older version in the current format
 
+        Returns:
+            Path of the entry to read, or None if there is no legacy entry
+        """
+        if CACHE_SUFFIX == LEGACY_SUFFIX:
+            return None
+
+        legacy_file = self._dirs[kind] / f"{cache_key}{LEGACY_SUFFIX}"
+        try:
+            legacy_stat = legacy_file.stat()
+        except FileNotFoundError:
+            return None
+
+        cache_file = self._dirs[kind] / f"{cache_key}{CACHE_SUFFIX}"
+        try:
+            _write_json(cache_file, _read_json(legacy_file))
+            # Keep the original mtime so the entry does not outlive its max age
+            os.utime(cache_file, (legacy_stat.st_atime, legacy_stat.st_mtime))
+            os.unlink(legacy_file)
         except Exception as e:
-            logger.warning(f"Invalid cache file {cache_file}: {e}")
-            return False
+            logger.warning(f"Failed to migrate cache file {legacy_file}: {e}")
+            return legacy_file
+
+        return cache_file
+
+    def _set_entry(self, kind: str, identifier: str, id_field: str, field: str, value: Dict):
+        """
+        Write a cache entry to disk and to memory
+
+        Args:
+            kind: Cache kind ('papers', 'repositories' or 'analysis')
+            identifier: Paper ID or repository URL
+            id_field: Key under which the identifier is stored
+            field: Key under which the payload is stored
+            value: Payload to cache
+        """
+        cache_key = self._get_cache_key(identifier)
+        cache_file = self._dirs[kind] / f"{cache_key}{CACHE_SUFFIX}"
+
+        is_new = not cache_file.exists()
+
+        try:
+            data = {
+                id_field: identifier,
+                field: value,
+                'cached_at': time.time(),
+            }
+
+            _write_json(cache_file, data)
+            if CACHE_SUFFIX != LEGACY_SUFFIX:
+                # An entry replacing a legacy file is not a new entry
+                try:
+                    os.unlink(self._dirs[kind] / f"{cache_key}{LEGACY_SUFFIX}")
+                    is_new = False
+                except FileNotFoundError:
+                    pass
+            if is_new:
+                # set_* runs on worker threads (bulk lookups, repository search)
+                with self._memory_lock:
+                    self._counts[kind] += 1
+            self._memory_set(kind, cache_key, value)
+
+            logger.debug(f"Cached {kind} entry for {identifier}")
+
+        except Exception as e:
+            logger.warning(f"Failed to cache {kind} entry: {e}")
 
     def get_paper_metadata(self, paper_id: str) -> Optional[Dict]:
         """
@@ -63,19 +331,7 @@ class ReproducerCache:
         Returns:
             Cached metadata or None
         """
-        cache_key = self._get_cache_key(paper_id)
-        cache_file = self.paper_cache_dir / f"{cache_key}.json"
-
-        if self._is_cache_valid(cache_file, max_age_days=30):
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                logger.info(f"Using cached paper metadata for {paper_id}")
-                return data['metadata']
-            except Exception as e:
-                logger.warning(f"Failed to read cache: {e}")
-
-        return None
+        return self._get_entry('papers', paper_id, 'metadata', max_age_days=30)
 
     def set_paper_metadata(self, paper_id: str, metadata: Dict):
         """
@@ -85,95 +341,43 @@ class ReproducerCache:
             paper_id: Paper identifier
             metadata: Metadata to cache
         """
-        cache_key = self._get_cache_key(paper_id)
-        cache_file = self.paper_cache_dir / f"{cache_key}.json"
-
-        try:
-            data = {
-                'paper_id': paper_id,
-                'metadata': metadata,
-                'cached_at': datetime.now().isoformat(),
-            }
+        self._set_entry('papers', paper_id, 'paper_id', 'metadata', metadata)
 
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+    def get_many_paper_metadata(self, paper_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get cached paper metadata for several papers at once
 
-            logger.debug(f"Cached paper metadata for {paper_id}")
+        Args:
+            paper_ids: Paper identifiers
 
-        except Exception as e:
-            logger.warning(f"Failed to cache metadata: {e}")
+        Returns:
+            Dict mapping each cached paper_id to its metadata (misses are omitted)
+        """
+        return self._get_many(self.get_paper_metadata, paper_ids)
 
     def get_repository_info(self, repo_url: str) -> Optional[Dict]:
         """Get cached repository information"""
-        cache_key = self._get_cache_key(repo_url)
-        cache_file = self.repo_cache_dir / f"{cache_key}.json"
-
-        if self._is_cache_valid(cache_file, max_age_days=7):
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                logger.info(f"Using cached repo info for {repo_url}")
-                return data['repo_info']
-            except Exception as e:
-                logger.warning(f"Failed to read cache: {e}")
-
-        return None
+        return self._get_entry('repositories', repo_url, 'repo_info', max_age_days=7)
 
     def set_repository_info(self, repo_url: str, repo_info: Dict):
         """Cache repository information"""
-        cache_key = self._get_cache_key(repo_url)
-        cache_file = self.repo_cache_dir / f"{cache_key}.json"
-
-        try:
-            data = {
-                'repo_url': repo_url,
-                'repo_info': repo_info,
-                'cached_at': datetime.now().isoformat(),
-            }
-
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+        self._set_entry('repositories', repo_url, 'repo_url', 'repo_info', repo_info)
 
-            logger.debug(f"Cached repo info for {repo_url}")
-
-        except Exception as e:
-            logger.warning(f"Failed to cache repo info: {e}")
+    def get_many_repository_info(self, repo_urls: List[str]) -> Dict[str, Dict]:
+        """Get cached repository information for several repositories at once"""
+        return self._get_many(self.get_repository_info, repo_urls)
 
     def get_analysis(self, repo_url: str) -> Optional[Dict]:
         """Get cached repository analysis"""
-        cache_key = self._get_cache_key(repo_url)
-        cache_file = self.analysis_cache_dir / f"{cache_key}.json"
-
-        if self._is_cache_valid(cache_file, max_age_days=3):
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                logger.info(f"Using cached analysis for {repo_url}")
-                return data['analysis']
-            except Exception as e:
-                logger.warning(f"Failed to read cache: {e}")
-
-        return None
+        return self._get_entry('analysis', repo_url, 'analysis', max_age_days=3)
 
     def set_analysis(self, repo_url: str, analysis: Dict):
         """Cache repository analysis"""
-        cache_key = self._get_cache_key(repo_url)
-        cache_file = self.analysis_cache_dir / f"{cache_key}.json"
-
-        try:
-            data = {
-                'repo_url': repo_url,
-                'analysis': analysis,
-                'cached_at': datetime.now().isoformat(),
-            }
-
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+        self._set_entry('analysis', repo_url, 'repo_url', 'analysis', analysis)
 
-            logger.debug(f"Cached analysis for {repo_url}")
-
-        except Exception as e:
-            logger.warning(f"Failed to cache analysis: {e}")
+    def get_many_analysis(self, repo_urls: List[str]) -> Dict[str, Dict]:
+        """Get cached repository analyses for several repositories at once"""
+        return self._get_many(self.get_analysis, repo_urls)
 
     def clear_cache(self, cache_type: Optional[str] = None):
         """
@@ -182,26 +386,20 @@ class ReproducerCache:
         Args:
             cache_type: Type of cache to clear ('papers', 'repositories', 'analysis', or None for all)
         """
-        if cache_type == 'papers' or cache_type is None:
-            for file in self.paper_cache_dir.glob('*.json'):
-                file.unlink()
-            logger.info("Cleared paper cache")
-
-        if cache_type == 'repositories' or cache_type is None:
-            for file in self.repo_cache_dir.glob('*.json'):
-                file.unlink()
-            logger.info("Cleared repository cache")
-
-        if cache_type == 'analysis' or cache_type is None:
-            for file in self.analysis_cache_dir.glob('*.json'):
-                file.unlink()
-            logger.info("Cleared analysis cache")
+        for kind, directory in self._dirs.items():
+            if cache_type == kind or cache_type is None:
+                self._clear_entries(directory)
+                with self._memory_lock:
+                    self._counts[kind] = 0
+                    self._memory[kind].clear()
+                logger.info(f"Cleared {kind} cache")
 
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
+        with self._memory_lock:
+            counts = dict(self._counts)
+
         return {
-            'papers': len(list(self.paper_cache_dir.glob('*.json'))),
-            'repositories': len(list(self.repo_cache_dir.glob('*.json'))),
-            'analysis': len(list(self.analysis_cache_dir.glob('*.json'))),
+            **counts,
             'cache_dir': str(self.cache_dir),
         }
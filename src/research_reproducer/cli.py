@@ -3,19 +3,46 @@ Command Line Interface
 Main entry point for the research reproducer tool
 """
 
+import json
 import logging
 import os
+import re
+import stat
 import sys
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.panel import Panel
+from rich.table import Table
 
-from .orchestrator import ReproductionOrchestrator
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from . import __version__
+from .cache import ReproducerCache
+from .gpu_utils import print_gpu_status
+
+# The orchestrator, ingestion and analysis modules pull in arxiv, pdfplumber,
+# bs4, ... and are imported by the commands that need them, so
+# --help and light commands start quickly
 
 console = Console()
 
+# Bare or prefixed arXiv identifier, e.g. 2301.12345, arXiv:2301.12345v2
+ARXIV_RE = re.compile(r'(?:arxiv:)?(\d{4}\.\d{4,5}(?:v\d+)?)$', re.IGNORECASE)
+
+
+def _is_file(path: str) -> bool:
+    """Check whether path is a regular file with a single stat call"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration"""
@@ -29,7 +56,7 @@ def setup_logging(verbose: bool = False):
 
 
 @click.group()
-@click.version_option(version='0.1.0')
+@click.version_option(version=__version__, prog_name='research-reproduce')
 def main():
     """
     Research Reproducer - Automatically reproduce research papers
@@ -76,16 +103,19 @@ def reproduce(source, source_type, work_dir, github_token, interactive, timeout,
     """
     setup_logging(verbose)
 
+    is_file = _is_file(source)
+
     # Auto-detect source type
     if source_type == 'auto':
+        arxiv_match = ARXIV_RE.match(source)
         if source.startswith('http://') or source.startswith('https://'):
             source_type = 'url'
-        elif source.endswith('.pdf') or Path(source).is_file():
+        elif source.endswith('.pdf') or is_file:
             source_type = 'pdf'
-        elif 'arxiv' in source.lower() or source.replace('.', '').replace('v', '').isdigit():
+        elif arxiv_match or 'arxiv' in source.lower():
             source_type = 'arxiv'
             # Clean arxiv ID
-            source = source.replace('arxiv:', '').replace('arXiv:', '')
+            source = arxiv_match.group(1) if arxiv_match else source.replace('arxiv:', '').replace('arXiv:', '')
         else:
             console.print("[red]Error: Could not auto-detect source type[/red]")
             console.print("Please specify --type explicitly")
@@ -94,6 +124,8 @@ def reproduce(source, source_type, work_dir, github_token, interactive, timeout,
     console.print(f"[dim]Source type: {source_type}[/dim]")
 
     # Create orchestrator
+    from .orchestrator import ReproductionOrchestrator
+
     orchestrator = ReproductionOrchestrator(
         work_dir=work_dir,
         github_token=github_token
@@ -102,7 +134,7 @@ def reproduce(source, source_type, work_dir, github_token, interactive, timeout,
     try:
         # Run reproduction based on source type
         if source_type == 'pdf':
-            if not Path(source).exists():
+            if not is_file:
                 console.print(f"[red]Error: PDF file not found: {source}[/red]")
                 sys.exit(1)
 
@@ -157,18 +189,18 @@ def analyze(paper_source, output, github_token, verbose):
     """
     setup_logging(verbose)
 
+    console.print(f"\n[bold cyan]Research Paper Analysis[/bold cyan]\n")
+
     from .paper_ingestion import PaperIngestion
     from .repo_finder import RepositoryFinder
 
-    console.print(f"\n[bold cyan]Research Paper Analysis[/bold cyan]\n")
-
     # Extract paper metadata
     ingestion = PaperIngestion()
 
     if paper_source.endswith('.pdf'):
         paper_metadata = ingestion.extract_from_pdf(paper_source)
-    elif 'arxiv' in paper_source.lower() or paper_source.replace('.', '').isdigit():
-        paper_metadata = ingestion.extract_from_arxiv(paper_source)
+    elif ARXIV_RE.match(paper_source) or 'arxiv' in paper_source.lower():
+        paper_metadata = ingestion.extract_metadata_only(paper_source)
     else:
         paper_metadata = ingestion.extract_from_url(paper_source)
 
@@ -189,7 +221,6 @@ def analyze(paper_source, output, github_token, verbose):
 
     console.print(f"\n[green]Found {len(repos)} repository(ies):[/green]\n")
 
-    from rich.table import Table
     table = Table(show_header=True)
     table.add_column("#", style="cyan")
     table.add_column("Repository", style="green")
@@ -197,26 +228,28 @@ def analyze(paper_source, output, github_token, verbose):
     table.add_column("Language", style="yellow")
     table.add_column("Source", style="dim")
 
-    for idx, repo in enumerate(repos, 1):
-        table.add_row(
-            str(idx),
-            repo['url'],
-            str(repo.get('stars', 'N/A')),
-            repo.get('language', 'N/A'),
-            repo.get('source', 'unknown')
-        )
+    rows = [
+        (str(idx), repo['url'], str(repo.get('stars', 'N/A')), repo.get('language', 'N/A'), repo.get('source', 'unknown'))
+        for idx, repo in enumerate(repos, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
     # Save report if requested
     if output:
-        import json
         report = {
             'paper': paper_metadata,
             'repositories': repos,
         }
-        with open(output, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson:
+            Path(output).write_bytes(
+                orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+        else:
+            with open(output, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
         console.print(f"\n[dim]Report saved to: {output}[/dim]")
 
 
@@ -232,12 +265,10 @@ def inspect(repo_path, verbose):
     """
     setup_logging(verbose)
 
-    from .repo_analyzer import RepositoryAnalyzer
-    from rich.table import Table
-    from rich.panel import Panel
-
     console.print(f"\n[bold cyan]Repository Inspection[/bold cyan]\n")
 
+    from .repo_analyzer import RepositoryAnalyzer
+
     analyzer = RepositoryAnalyzer(Path(repo_path))
     analysis = analyzer.analyze()
 
@@ -317,8 +348,6 @@ def cache():
 @cache.command('stats')
 def cache_stats():
     """Show cache statistics"""
-    from .cache import ReproducerCache
-
     c = ReproducerCache()
     stats = c.get_cache_stats()
 
@@ -335,8 +364,6 @@ def cache_stats():
 @click.confirmation_option(prompt='Are you sure you want to clear the cache?')
 def cache_clear(cache_type):
     """Clear cache"""
-    from .cache import ReproducerCache
-
     c = ReproducerCache()
 
     if cache_type == 'all':
@@ -350,40 +377,7 @@ def cache_clear(cache_type):
 @main.command()
 def gpu():
     """Check GPU availability and status"""
-    from .gpu_utils import get_gpu_requirements_summary
-    from rich.table import Table
-
-    console.print("\n[bold cyan]GPU Status[/bold cyan]\n")
-
-    gpu_info = get_gpu_requirements_summary()
-
-    if gpu_info['gpu_available']:
-        console.print(f"[green]✓[/green] {gpu_info['gpu_count']} GPU(s) available")
-        console.print(f"Total Memory: {gpu_info['total_memory_gb']} GB")
-        console.print(f"Free Memory: {gpu_info['free_memory_gb']} GB")
-
-        if gpu_info['cuda_version']:
-            console.print(f"CUDA Version: {gpu_info['cuda_version']}")
-
-        if gpu_info['gpus']:
-            console.print("\n[bold]GPUs:[/bold]")
-            table = Table(show_header=True)
-            table.add_column("Index", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Memory", style="yellow")
-
-            for gpu in gpu_info['gpus']:
-                table.add_row(
-                    str(gpu['index']),
-                    gpu['name'],
-                    f"{gpu['memory_total_mb']} MB"
-                )
-
-            console.print(table)
-    else:
-        console.print("[yellow]⚠[/yellow] No GPU detected")
-        console.print("\nML papers may fail or run slowly without GPU.")
-        console.print("Consider using cloud GPU services (Colab, Paperspace, etc.)")
+    print_gpu_status(console)
 
 
 if __name__ == '__main__':
@@ -3,26 +3,105 @@ Environment Setup Module
 Sets up isolated environments for running research code
 """
 
+import functools
 import logging
 import os
+import shutil
 import subprocess
+import threading
+import time
+import venv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+_IS_WIN = os.name == 'nt'
+_BINDIR = 'Scripts' if _IS_WIN else 'bin'
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_available(name: str) -> bool:
+    """Check whether an executable is on PATH, caching the answer per process"""
+    return shutil.which(name) is not None
+
 
 class EnvironmentSetup:
     """Setup isolated environments for code execution"""
 
-    def __init__(self, work_dir: Path):
+    # Only the end of a failing tool's stderr is kept in error messages
+    STDERR_TAIL = 4096
+    # Docker builds are streamed, keeping only the last lines of the log
+    BUILD_LOG_TAIL = 500
+    DOCKER_BUILD_TIMEOUT = 1800  # 30 minutes
+    NODE_LANGUAGES = frozenset({'JavaScript', 'TypeScript'})
+
+    def __init__(self, work_dir: Path, pip_cache_dir: Optional[Path] = None):
         """
         Args:
             work_dir: Working directory for environments
+            pip_cache_dir: Wheel cache to pass to pip. By default pip uses its own
+                cache (shared by every environment, and honoring PIP_CACHE_DIR /
+                PIP_NO_CACHE_DIR); pip creates the directory if needed.
         """
         self.work_dir = Path(work_dir)
         self.work_dir.mkdir(parents=True, exist_ok=True)
 
+        self.pip_cache_dir = Path(pip_cache_dir) if pip_cache_dir else None
+
+    def _pip_cache_args(self) -> List[str]:
+        """pip options selecting the wheel cache, if one was given"""
+        return ['--cache-dir', str(self.pip_cache_dir)] if self.pip_cache_dir else []
+
+    def _run(self, cmd: List[str], timeout: int = 600, cwd: Optional[Path] = None) -> Optional[str]:
+        """
+        Run a setup command to completion
+
+        Args:
+            cmd: Command and arguments
+            timeout: Timeout in seconds
+            cwd: Working directory for the command
+
+        Returns:
+            None on success, otherwise the tail of stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command runs longer than timeout,
+                so a half-finished step always fails the setup
+        """
+        try:
+            subprocess.run(
+                cmd,
+                cwd=str(cwd) if cwd else None,
+                check=True,
+                capture_output=True,
+                text=True,
+                errors='replace',
+                timeout=timeout
+            )
+        except subprocess.CalledProcessError as e:
+            return e.stderr[-self.STDERR_TAIL:] or f"exited with status {e.returncode}"
+
+        return None
+
+    @staticmethod
+    def _list_files(repo_path: Path) -> Set[str]:
+        """Names of the files at the top of repo_path, from a single directory scan"""
+        try:
+            with os.scandir(repo_path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+
+    @staticmethod
+    def _has_file(repo_path: Path, rel_path: str, repo_files: Set[str]) -> bool:
+        """Check a repo-relative file against the scan, statting only nested paths"""
+        if rel_path in repo_files:
+            return True
+        return ('/' in rel_path or os.sep in rel_path) and (repo_path / rel_path).is_file()
+
     def setup_python_venv(
         self,
         repo_path: Path,
@@ -53,64 +132,48 @@ class EnvironmentSetup:
         }
 
         try:
-            # Create virtual environment
-            python_cmd = 'python3' if not python_version else f'python{python_version}'
-            cmd = [python_cmd, '-m', 'venv', str(env_path)]
-
-            subprocess.run(cmd, check=True, capture_output=True)
+            # Create virtual environment. A specific version needs that interpreter,
+            # otherwise the running one builds it without spawning another Python.
+            if python_version:
+                error = self._run([f'python{python_version}', '-m', 'venv', str(env_path)], timeout=300)
+                if error:
+                    raise RuntimeError(error)
+            else:
+                venv.EnvBuilder(with_pip=True, symlinks=not _IS_WIN).create(str(env_path))
             logger.info(f"Created virtual environment at {env_path}")
 
             # Determine activation command
-            if os.name == 'nt':  # Windows
-                result['activation_command'] = str(env_path / 'Scripts' / 'activate.bat')
-                pip_cmd = str(env_path / 'Scripts' / 'pip')
-            else:  # Unix
-                result['activation_command'] = f'source {env_path}/bin/activate'
-                pip_cmd = str(env_path / 'bin' / 'pip')
+            bin_dir = env_path / _BINDIR
+            result['activation_command'] = str(bin_dir / 'activate.bat') if _IS_WIN else f'source {bin_dir}/activate'
+            python_path = str(bin_dir / ('python.exe' if _IS_WIN else 'python'))
 
-            # Upgrade pip
-            subprocess.run([pip_cmd, 'install', '--upgrade', 'pip'], check=True, capture_output=True)
+            # venv already seeds pip, so it is used as-is rather than upgraded first
+            pip_cmd = [python_path, '-m', 'pip']
 
-            # Install dependencies
+            # Install dependencies in a single pip run so the resolver only runs once
             python_deps = analysis['dependencies'].get('python', {})
+            pip_args = []
+
+            repo_files = self._list_files(repo_path)
+
+            for req_file in python_deps.get('requirements_files', []):
+                if self._has_file(repo_path, req_file, repo_files):
+                    pip_args.extend(['-r', str(repo_path / req_file)])
 
-            # Install from requirements.txt
-            if python_deps.get('requirements_files'):
-                for req_file in python_deps['requirements_files']:
-                    req_path = repo_path / req_file
-                    if req_path.exists():
-                        logger.info(f"Installing from {req_file}")
-                        try:
-                            subprocess.run(
-                                [pip_cmd, 'install', '-r', str(req_path)],
-                                check=True,
-                                capture_output=True,
-                                timeout=600
-                            )
-                        except subprocess.CalledProcessError as e:
-                            error_msg = f"Failed to install from {req_file}: {e.stderr.decode()}"
-                            result['errors'].append(error_msg)
-                            logger.warning(error_msg)
-
-            # Install from setup.py
-            if python_deps.get('setup_py'):
-                setup_path = repo_path / 'setup.py'
-                if setup_path.exists():
-                    logger.info("Installing from setup.py")
-                    try:
-                        subprocess.run(
-                            [pip_cmd, 'install', '-e', str(repo_path)],
-                            check=True,
-                            capture_output=True,
-                            timeout=600
-                        )
-                    except subprocess.CalledProcessError as e:
-                        error_msg = f"Failed to install from setup.py: {e.stderr.decode()}"
-                        result['errors'].append(error_msg)
-                        logger.warning(error_msg)
+            if python_deps.get('setup_py') and 'setup.py' in repo_files:
+                pip_args.extend(['-e', str(repo_path)])
+
+            if pip_args:
+                logger.info(f"Installing Python dependencies: {' '.join(pip_args)}")
+                error = self._run([*pip_cmd, 'install', '--no-input', '--disable-pip-version-check',
+                                   *self._pip_cache_args(), *pip_args])
+                if error:
+                    error_msg = f"Failed to install Python dependencies: {error}"
+                    result['errors'].append(error_msg)
+                    logger.warning(error_msg)
 
             result['success'] = True
-            result['python_path'] = str(env_path / 'bin' / 'python') if os.name != 'nt' else str(env_path / 'Scripts' / 'python.exe')
+            result['python_path'] = python_path
 
         except Exception as e:
             error_msg = f"Failed to setup Python environment: {e}"
@@ -146,7 +209,8 @@ class EnvironmentSetup:
 
         try:
             # Check if conda is available
-            subprocess.run(['conda', '--version'], check=True, capture_output=True)
+            if not _tool_available('conda'):
+                raise FileNotFoundError('conda')
 
             python_deps = analysis['dependencies'].get('python', {})
 
@@ -156,22 +220,30 @@ class EnvironmentSetup:
                 logger.info(f"Creating conda environment from {env_file}")
 
                 cmd = ['conda', 'env', 'create', '-f', str(env_file), '-n', env_name]
-                subprocess.run(cmd, check=True, capture_output=True, timeout=600)
+                error = self._run(cmd)
+                if error:
+                    raise RuntimeError(error)
 
             else:
                 # Create basic conda environment
                 logger.info(f"Creating conda environment '{env_name}'")
                 cmd = ['conda', 'create', '-n', env_name, 'python=3.9', '-y']
-                subprocess.run(cmd, check=True, capture_output=True, timeout=300)
+                error = self._run(cmd, timeout=300)
+                if error:
+                    raise RuntimeError(error)
 
                 # Install pip dependencies
                 if python_deps.get('requirements_files'):
+                    repo_files = self._list_files(repo_path)
                     for req_file in python_deps['requirements_files']:
                         req_path = repo_path / req_file
-                        if req_path.exists():
+                        if self._has_file(repo_path, req_file, repo_files):
                             logger.info(f"Installing from {req_file}")
-                            cmd = ['conda', 'run', '-n', env_name, 'pip', 'install', '-r', str(req_path)]
-                            subprocess.run(cmd, check=True, capture_output=True, timeout=600)
+                            cmd = ['conda', 'run', '-n', env_name, 'pip', 'install', '--disable-pip-version-check',
+                                   *self._pip_cache_args(), '-r', str(req_path)]
+                            error = self._run(cmd)
+                            if error:
+                                raise RuntimeError(error)
 
             result['success'] = True
 
@@ -213,18 +285,21 @@ class EnvironmentSetup:
 
         try:
             # Check if Docker is available
-            subprocess.run(['docker', '--version'], check=True, capture_output=True)
+            if not _tool_available('docker'):
+                raise FileNotFoundError('docker')
 
             # Find Dockerfile
-            dockerfiles = [f for f in analysis['container_files'] if 'Dockerfile' in f]
+            dockerfile = next(
+                (f for f in analysis['container_files'] if os.path.basename(f).startswith('Dockerfile')),
+                None
+            )
 
-            if not dockerfiles:
+            if dockerfile is None:
                 error_msg = "No Dockerfile found"
                 result['errors'].append(error_msg)
                 logger.error(error_msg)
                 return result
 
-            dockerfile = dockerfiles[0]
             dockerfile_path = repo_path / dockerfile
 
             logger.info(f"Building Docker image from {dockerfile}")
@@ -237,18 +312,39 @@ class EnvironmentSetup:
                 str(repo_path)
             ]
 
-            process = subprocess.run(
+            tail = deque(maxlen=self.BUILD_LOG_TAIL)
+            deadline = time.monotonic() + self.DOCKER_BUILD_TIMEOUT
+
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                timeout=1800  # 30 minutes
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors='replace',
+                bufsize=1
             )
+            # Kill the build on overrun even if it stops producing output
+            watchdog = threading.Timer(self.DOCKER_BUILD_TIMEOUT, process.kill)
+            watchdog.start()
+
+            try:
+                for line in process.stdout:
+                    tail.append(line)
+                    logger.debug(line.rstrip())
+                process.wait()
+            finally:
+                watchdog.cancel()
+                process.stdout.close()
+
+            if time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(cmd, self.DOCKER_BUILD_TIMEOUT)
 
             if process.returncode == 0:
                 result['success'] = True
                 result['run_command'] = f'docker run -it {image_name}'
                 logger.info(f"Successfully built Docker image: {image_name}")
             else:
-                error_msg = f"Docker build failed: {process.stderr.decode()}"
+                error_msg = f"Docker build failed: {''.join(tail)}"
                 result['errors'].append(error_msg)
                 logger.error(error_msg)
 
@@ -257,7 +353,7 @@ class EnvironmentSetup:
             result['errors'].append(error_msg)
             logger.error(error_msg)
         except subprocess.TimeoutExpired:
-            error_msg = "Docker build timed out (30 minutes)"
+            error_msg = f"Docker build timed out ({self.DOCKER_BUILD_TIMEOUT // 60} minutes)"
             result['errors'].append(error_msg)
             logger.error(error_msg)
         except Exception as e:
@@ -290,7 +386,8 @@ class EnvironmentSetup:
 
         try:
             # Check if npm is available
-            subprocess.run(['npm', '--version'], check=True, capture_output=True)
+            if not _tool_available('npm'):
+                raise FileNotFoundError('npm')
 
             node_deps = analysis['dependencies'].get('node', {})
 
@@ -298,13 +395,9 @@ class EnvironmentSetup:
                 logger.info("Installing Node.js dependencies")
 
                 # Install dependencies
-                subprocess.run(
-                    ['npm', 'install'],
-                    cwd=str(repo_path),
-                    check=True,
-                    capture_output=True,
-                    timeout=600
-                )
+                error = self._run(['npm', 'install'], cwd=repo_path)
+                if error:
+                    raise RuntimeError(error)
 
                 result['success'] = True
                 logger.info("Node.js dependencies installed successfully")
@@ -347,29 +440,22 @@ class EnvironmentSetup:
                 return result
             logger.warning("Docker setup failed, falling back to other methods")
 
-        # Setup environments based on detected languages
-        results = []
-
-        if 'Python' in analysis['languages']:
-            if prefer_conda:
-                logger.info("Attempting Conda setup")
-                result = self.setup_conda_env(repo_path, analysis)
-                if result['success']:
-                    results.append(result)
-                else:
-                    # Fallback to venv
-                    logger.info("Conda setup failed, trying venv")
-                    result = self.setup_python_venv(repo_path, analysis)
-                    results.append(result)
-            else:
-                logger.info("Attempting Python venv setup")
-                result = self.setup_python_venv(repo_path, analysis)
-                results.append(result)
+        # Setup environments based on detected languages. The per-language
+        # setups use separate toolchains and directories, so run them together.
+        languages = frozenset(analysis['languages'])
+        setups = []
 
-        if any(lang in analysis['languages'] for lang in ['JavaScript', 'TypeScript']):
-            logger.info("Attempting Node.js setup")
-            result = self.setup_node_env(repo_path, analysis)
-            results.append(result)
+        if 'Python' in languages:
+            setups.append(lambda: self._setup_python(repo_path, analysis, prefer_conda))
+
+        if languages & self.NODE_LANGUAGES:
+            setups.append(lambda: self._setup_node(repo_path, analysis))
+
+        if len(setups) > 1:
+            with ThreadPoolExecutor(max_workers=len(setups)) as executor:
+                results = list(executor.map(lambda setup: setup(), setups))
+        else:
+            results = [setup() for setup in setups]
 
         # Return combined results
         if results:
@@ -386,3 +472,22 @@ class EnvironmentSetup:
                 'success': False,
                 'errors': ['No compatible environment setup found'],
             }
+
+    def _setup_python(self, repo_path: Path, analysis: Dict, prefer_conda: bool) -> Dict:
+        """Setup a Python environment, falling back from Conda to venv"""
+        if prefer_conda:
+            logger.info("Attempting Conda setup")
+            result = self.setup_conda_env(repo_path, analysis)
+            if result['success']:
+                return result
+            # Fallback to venv
+            logger.info("Conda setup failed, trying venv")
+        else:
+            logger.info("Attempting Python venv setup")
+
+        return self.setup_python_venv(repo_path, analysis)
+
+    def _setup_node(self, repo_path: Path, analysis: Dict) -> Dict:
+        """Setup a Node.js environment"""
+        logger.info("Attempting Node.js setup")
+        return self.setup_node_env(repo_path, analysis)
@@ -3,9 +3,16 @@ Smart Error Diagnosis
 Analyzes errors and provides helpful suggestions for fixes
 """
 
+import functools
 import re
 import logging
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +20,48 @@ logger = logging.getLogger(__name__)
 class ErrorDiagnoser:
     """Diagnose errors and suggest fixes"""
 
+    # No pattern is anchored, so MULTILINE would only add matcher overhead
+    PATTERN_FLAGS = re.IGNORECASE
+    FIX_PLACEHOLDERS = ('{module}', '{key}', '{file}')
+    # Diagnoses of recently seen error texts, per diagnoser
+    DIAGNOSIS_CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize error patterns and fixes"""
         self.error_patterns = self._initialize_patterns()
 
+        # Patterns are ranked by their order in error_patterns. Each one is
+        # compiled once, and a single alternation of all of them finds a
+        # candidate match in one scan of the text.
+        self._ranked = tuple(self.error_patterns)
+        self._priority = {error_type: i for i, error_type in enumerate(self._ranked)}
+        self._compiled = {
+            error_type: re.compile(info['pattern'], self.PATTERN_FLAGS)
+            for error_type, info in self.error_patterns.items()
+        }
+        self._combined = re.compile(
+            '|'.join(f"(?P<{error_type}>{info['pattern']})" for error_type, info in self.error_patterns.items()),
+            self.PATTERN_FLAGS
+        )
+
+        # Each fix paired with the placeholder it contains (if any), so
+        # diagnose() substitutes details without rescanning every fix
+        self._fix_templates = {
+            error_type: tuple(
+                (fix, next((ph for ph in self.FIX_PLACEHOLDERS if ph in fix), None))
+                for fix in info['fixes']
+            )
+            for error_type, info in self.error_patterns.items()
+        }
+
+        # With Hyperscan installed, all patterns are scanned by its DFA instead
+        self._hs_db = self._build_hyperscan_db() if hyperscan else None
+        self._hs_local = threading.local()
+
+        # Repeated tracebacks (retries, the same error in errors and stderr)
+        # skip the regex work; bound per instance so the cache dies with it
+        self._diagnose_text = functools.lru_cache(maxsize=self.DIAGNOSIS_CACHE_SIZE)(self._diagnose_text)
+
     def _initialize_patterns(self) -> Dict[str, Dict]:
         """Initialize common error patterns and their fixes"""
         return {
@@ -40,7 +85,7 @@ class ErrorDiagnoser:
                 ]
             },
             'CUDA_ERROR': {
-                'pattern': r"CUDA|cuda|RuntimeError: CUDA",
+                'pattern': r"CUDA",
                 'category': 'gpu',
                 'fixes': [
                     "Install CUDA toolkit matching PyTorch/TensorFlow version",
@@ -120,7 +165,7 @@ class ErrorDiagnoser:
                 ]
             },
             'VersionConflict': {
-                'pattern': r"version|Version|compatible|compatibility",
+                'pattern': r"version|compatib(?:le|ility)",
                 'category': 'dependency',
                 'fixes': [
                     "Check package version requirements",
@@ -142,6 +187,23 @@ class ErrorDiagnoser:
         Returns:
             Dict with diagnosis and suggested fixes
         """
+        cached = self._diagnose_text(error_message)
+        diagnosis = {**cached, 'suggested_fixes': list(cached['suggested_fixes'])}
+
+        # Add context-specific suggestions
+        if context:
+            additional_fixes = self._get_context_specific_fixes(diagnosis, context)
+            diagnosis['suggested_fixes'].extend(additional_fixes)
+
+        return diagnosis
+
+    def _diagnose_text(self, error_message: str) -> Dict:
+        """
+        Diagnose the error text alone, before any context is applied
+
+        The returned dict is cached and shared, so callers must copy it
+        before modifying it.
+        """
         diagnosis = {
             'error_type': 'unknown',
             'category': 'unknown',
@@ -152,45 +214,108 @@ class ErrorDiagnoser:
         }
 
         # Try to match error patterns
-        for error_type, info in self.error_patterns.items():
-            pattern = info['pattern']
-            match = re.search(pattern, error_message, re.IGNORECASE | re.MULTILINE)
+        found = self._match_pattern(error_message)
 
-            if match:
-                diagnosis['error_type'] = error_type
-                diagnosis['category'] = info['category']
-                diagnosis['matched_pattern'] = True
-
-                # Extract specific details (like module name, key, etc.)
-                if match.groups():
-                    detail = match.group(1)
-                    diagnosis['root_cause'] = detail
-
-                    # Customize fixes with specific details
-                    fixes = []
-                    for fix in info['fixes']:
-                        if '{module}' in fix:
-                            fixes.append(fix.format(module=detail))
-                        elif '{key}' in fix:
-                            fixes.append(fix.format(key=detail))
-                        elif '{file}' in fix:
-                            fixes.append(fix.format(file=detail))
-                        else:
-                            fixes.append(fix)
-
-                    diagnosis['suggested_fixes'] = fixes
-                else:
-                    diagnosis['suggested_fixes'] = info['fixes']
-
-                break
+        if found:
+            error_type, match = found
+            info = self.error_patterns[error_type]
 
-        # Add context-specific suggestions
-        if context:
-            additional_fixes = self._get_context_specific_fixes(diagnosis, context)
-            diagnosis['suggested_fixes'].extend(additional_fixes)
+            diagnosis['error_type'] = error_type
+            diagnosis['category'] = info['category']
+            diagnosis['matched_pattern'] = True
+
+            # Extract specific details (like module name, key, etc.)
+            if match.groups():
+                detail = match.group(1)
+                diagnosis['root_cause'] = detail
+
+                # Customize fixes with specific details
+                diagnosis['suggested_fixes'] = [
+                    fix.replace(placeholder, detail) if placeholder else fix
+                    for fix, placeholder in self._fix_templates[error_type]
+                ]
+            else:
+                diagnosis['suggested_fixes'] = info['fixes']
 
         return diagnosis
 
+    def _build_hyperscan_db(self):
+        """Compile all error patterns into one Hyperscan database, or None if it fails"""
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[info['pattern'].encode() for info in self.error_patterns.values()],
+                ids=list(range(len(self._ranked))),
+                flags=[flags] * len(self._ranked)
+            )
+            return db
+        except hyperscan.error as e:
+            logger.debug(f"Hyperscan unavailable for error patterns, using re: {e}")
+            return None
+
+    def _match_pattern(self, text: str) -> Optional[Tuple[str, re.Match]]:
+        """
+        Find the highest-priority error pattern that matches anywhere in text
+
+        Args:
+            text: Error message/stack trace
+
+        Returns:
+            Tuple of (error type, match) or None if no pattern matches
+        """
+        if self._hs_db is not None:
+            found = self._match_pattern_hyperscan(text)
+            if found is not False:
+                return found
+
+        candidate = self._combined.search(text)
+        if candidate is None:
+            return None
+
+        # The earliest match in the text is not necessarily the highest-ranked
+        # pattern, so only the patterns ranked above it still need a search
+        error_type = candidate.lastgroup
+        for higher in self._ranked[:self._priority[error_type]]:
+            match = self._compiled[higher].search(text)
+            if match:
+                return higher, match
+
+        return error_type, self._compiled[error_type].match(text, candidate.start())
+
+    def _match_pattern_hyperscan(self, text: str):
+        """
+        Hyperscan version of _match_pattern
+
+        Hyperscan only reports which patterns match, so the winning pattern is
+        searched once more with re for its capture groups. Returns False if
+        the two engines disagree, so the caller falls back to re.
+        """
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            # Scratch space must not be shared between threads
+            scratch = self._hs_local.scratch = hyperscan.Scratch(self._hs_db)
+
+        hits = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append(pattern_id)
+            # Nothing outranks the first pattern, so stop there
+            return pattern_id == 0
+
+        try:
+            self._hs_db.scan(text.encode('utf-8', errors='replace'), match_event_handler=on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass
+
+        if not hits:
+            return None
+
+        error_type = self._ranked[min(hits)]
+        match = self._compiled[error_type].search(text)
+        return (error_type, match) if match else False
+
     def _get_context_specific_fixes(self, diagnosis: Dict, context: Dict) -> List[str]:
         """Get additional fixes based on context"""
         fixes = []
@@ -211,41 +336,47 @@ class ErrorDiagnoser:
 
         return fixes
 
-    def analyze_execution_result(self, result_dict: Dict) -> Dict:
+    def analyze_execution_result(self, result) -> Dict:
         """
         Analyze full execution result
 
         Args:
-            result_dict: ExecutionResult.to_dict()
+            result: ExecutionResult, or its to_dict() output
 
         Returns:
             Comprehensive diagnosis
         """
+        if isinstance(result, dict):
+            get = result.get
+        else:
+            # Read the attributes directly instead of building to_dict()
+            def get(key, default=None):
+                return getattr(result, key, default)
+
         diagnosis = {
-            'success': result_dict.get('success', False),
-            'exit_code': result_dict.get('exit_code'),
-            'execution_time': result_dict.get('execution_time', 0),
+            'success': get('success', False),
+            'exit_code': get('exit_code'),
+            'execution_time': get('execution_time', 0),
             'errors': [],
             'warnings': [],
             'recommendations': []
         }
 
         # Analyze errors
-        if result_dict.get('errors'):
-            for error in result_dict['errors']:
-                error_diagnosis = self.diagnose(error)
-                diagnosis['errors'].append(error_diagnosis)
+        for error in get('errors') or ():
+            error_diagnosis = self.diagnose(error)
+            diagnosis['errors'].append(error_diagnosis)
 
         # Analyze stderr
-        stderr = result_dict.get('stderr', '')
+        stderr = get('stderr', '')
         if stderr:
             error_diagnosis = self.diagnose(stderr)
             if error_diagnosis['matched_pattern']:
                 diagnosis['errors'].append(error_diagnosis)
 
         # Analyze warnings
-        if result_dict.get('warnings'):
-            diagnosis['warnings'] = result_dict['warnings']
+        if get('warnings'):
+            diagnosis['warnings'] = get('warnings')
 
         # Generate recommendations
         if not diagnosis['success']:
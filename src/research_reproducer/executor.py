@@ -3,26 +3,125 @@ Code Execution Engine
 Executes research code with monitoring and error handling
 """
 
+import codecs
+import functools
+import itertools
 import logging
 import os
+import re
+import selectors
+import shlex
 import signal
 import subprocess
-import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import BinaryIO, Dict, Optional, List, Tuple
 from rich.console import Console
+from rich.text import Text
 from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Common error patterns
+ERROR_MARKERS = (
+    'Error:',
+    'ERROR:',
+    'Exception:',
+    'Traceback',
+    'FAILED',
+    'ImportError',
+    'ModuleNotFoundError',
+    'FileNotFoundError',
+    'RuntimeError',
+    'ValueError',
+    'TypeError',
+)
+WARNING_MARKERS = ('Warning:', 'WARNING:')
+
+# Commands using any of this are handed to /bin/sh; the rest are exec'd directly
+_SHELL_SYNTAX_RE = re.compile(r'[|&;<>()$`*?\[\]{}~#\n]')
+_SHELL_BUILTINS = frozenset({'cd', 'source', '.', 'export', 'set', 'unset', 'alias', 'eval', 'exec'})
+
+_ERROR_RE = re.compile('|'.join(map(re.escape, ERROR_MARKERS)))
+_WARNING_RE = re.compile('|'.join(map(re.escape, WARNING_MARKERS)))
+
+
+def _matching_lines(text: str, marker_re: re.Pattern) -> List[str]:
+    """
+    Collect the lines of text that contain a marker
+
+    Scans the whole text once with the marker alternation and skips to the
+    end of each matching line, instead of testing every marker on every line.
+
+    Returns:
+        Unique stripped lines, in order of first appearance
+    """
+    lines = {}
+    match = marker_re.search(text)
+
+    while match:
+        start = text.rfind('\n', 0, match.start()) + 1
+        end = text.find('\n', match.end())
+        if end == -1:
+            end = len(text)
+
+        lines[text[start:end].strip()] = None
+        match = marker_re.search(text, end)
+
+    return list(lines)
+
+
+def _split_command(command: str) -> Optional[List[str]]:
+    """
+    Split a command line for direct execution
+
+    Returns:
+        Argument list, or None if the command needs a shell (pipes,
+        redirects, globs, variable assignments, builtins, ...)
+    """
+    if _SHELL_SYNTAX_RE.search(command):
+        return None
+
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+
+    if not args or '=' in args[0] or args[0] in _SHELL_BUILTINS:
+        return None
+
+    return args
+
+
+def _kill_process_group(process: subprocess.Popen):
+    """Kill a process started in its own session along with its children"""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        process.kill()
+
+
+@functools.lru_cache(maxsize=1)
+def _nvidia_gpu_available() -> bool:
+    """Check once per process whether nvidia-smi runs successfully"""
+    try:
+        subprocess.run(['nvidia-smi'], check=True, capture_output=True, timeout=5)
+        return True
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return False
+
 
 class ExecutionResult:
     """Container for execution results"""
 
+    __slots__ = (
+        'success', 'exit_code', 'stdout', 'stderr', 'execution_time', 'errors',
+        'warnings', 'start_time', 'end_time', 'timed_out', 'log_file',
+    )
+
     def __init__(self):
         self.success = False
         self.exit_code = None
@@ -34,6 +133,7 @@ class ExecutionResult:
         self.start_time = None
         self.end_time = None
         self.timed_out = False
+        self.log_file = None
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -45,15 +145,22 @@ class ExecutionResult:
             'execution_time': self.execution_time,
             'errors': self.errors,
             'warnings': self.warnings,
-            'start_time': str(self.start_time) if self.start_time else None,
-            'end_time': str(self.end_time) if self.end_time else None,
+            'start_time': self.start_time.isoformat(' ') if self.start_time else None,
+            'end_time': self.end_time.isoformat(' ') if self.end_time else None,
             'timed_out': self.timed_out,
+            'log_file': self.log_file,
         }
 
 
 class CodeExecutor:
     """Execute research code with monitoring"""
 
+    # Bytes read from a child's pipe per wakeup when streaming output
+    READ_CHUNK_SIZE = 65536
+    # Streamed output goes to the log file; only this much of each stream is
+    # kept in memory for the result and error analysis
+    OUTPUT_TAIL_BYTES = 256 * 1024
+
     def __init__(self, repo_path: Path, env_info: Dict, work_dir: Path):
         """
         Args:
@@ -66,6 +173,24 @@ class CodeExecutor:
         self.work_dir = Path(work_dir)
         self.work_dir.mkdir(parents=True, exist_ok=True)
 
+    def _open_log(self) -> Tuple[Path, BinaryIO]:
+        """
+        Create a new log file for one run
+
+        The log is the only full copy of the output, so runs starting in the
+        same second get suffixed names instead of overwriting each other.
+
+        Returns:
+            Tuple of (path, file opened for binary writing)
+        """
+        stem = f"execution_{int(time.time())}"
+        for attempt in itertools.count():
+            log_file = self.work_dir / (f"{stem}.log" if attempt == 0 else f"{stem}_{attempt}.log")
+            try:
+                return log_file, open(log_file, 'xb')
+            except FileExistsError:
+                continue
+
     def execute(
         self,
         command: str,
@@ -87,6 +212,8 @@ class CodeExecutor:
         """
         result = ExecutionResult()
         result.start_time = datetime.now()
+        # Duration comes from the monotonic clock; the datetimes are for display
+        start = time.monotonic()
 
         console.print(f"\n[bold cyan]Executing:[/bold cyan] {command}")
         console.print(f"[dim]Working directory: {self.repo_path}[/dim]")
@@ -104,13 +231,24 @@ class CodeExecutor:
             env['VIRTUAL_ENV'] = self.env_info['path']
 
         # Log output to file
-        log_file = self.work_dir / f"execution_{int(time.time())}.log"
+        try:
+            log_file, log = self._open_log()
+            log.write(f"Command: {command}\n".encode())
+            result.log_file = str(log_file)
+        except OSError as e:
+            logger.warning(f"Failed to write log file: {e}")
+            log_file = log = None
+
+        # Run plain commands without an intermediate shell. Either way the
+        # command gets its own session so a timeout can kill all of it.
+        args = _split_command(command)
 
         try:
             # Start process
             process = subprocess.Popen(
-                command,
-                shell=True,
+                command if args is None else args,
+                shell=args is None,
+                start_new_session=True,
                 stdout=subprocess.PIPE if capture_output else None,
                 stderr=subprocess.PIPE if capture_output else None,
                 cwd=str(self.repo_path),
@@ -120,83 +258,81 @@ class CodeExecutor:
                 universal_newlines=True,
             )
 
-            # Stream output if requested
-            if capture_output and stream_output:
-                stdout_lines = []
-                stderr_lines = []
-
-                def read_stdout():
-                    for line in process.stdout:
-                        stdout_lines.append(line)
-                        console.print(line, end='')
-
-                def read_stderr():
-                    for line in process.stderr:
-                        stderr_lines.append(line)
-                        console.print(f"[red]{line}[/red]", end='')
-
-                stdout_thread = threading.Thread(target=read_stdout)
-                stderr_thread = threading.Thread(target=read_stderr)
-
-                stdout_thread.start()
-                stderr_thread.start()
-
-                # Wait with timeout
-                try:
-                    process.wait(timeout=timeout)
-                    stdout_thread.join(timeout=1)
-                    stderr_thread.join(timeout=1)
-
-                    result.stdout = ''.join(stdout_lines)
-                    result.stderr = ''.join(stderr_lines)
-
-                except subprocess.TimeoutExpired:
-                    console.print(f"\n[yellow]⚠ Execution timed out after {timeout} seconds[/yellow]")
-                    process.kill()
-                    result.timed_out = True
-                    result.errors.append(f"Execution timed out after {timeout} seconds")
-
-            else:
-                # Simple wait
-                try:
-                    stdout, stderr = process.communicate(timeout=timeout)
-                    if capture_output:
-                        result.stdout = stdout or ""
-                        result.stderr = stderr or ""
-                except subprocess.TimeoutExpired:
-                    console.print(f"\n[yellow]⚠ Execution timed out after {timeout} seconds[/yellow]")
-                    process.kill()
-                    stdout, stderr = process.communicate()
-                    result.timed_out = True
-                    result.errors.append(f"Execution timed out after {timeout} seconds")
-                    if capture_output:
-                        result.stdout = stdout or ""
-                        result.stderr = stderr or ""
+            try:
+                # Stream output if requested
+                if capture_output and stream_output:
+                    if log:
+                        log.write(b"\n--- OUTPUT ---\n")
+                    result.stdout, result.stderr, result.timed_out = self._stream_output(process, timeout, log)
+
+                    if result.timed_out:
+                        console.print(f"\n[yellow]⚠ Execution timed out after {timeout} seconds[/yellow]")
+                        result.errors.append(f"Execution timed out after {timeout} seconds")
+
+                else:
+                    # Simple wait
+                    try:
+                        stdout, stderr = process.communicate(timeout=timeout)
+                        if capture_output:
+                            result.stdout = stdout or ""
+                            result.stderr = stderr or ""
+                    except subprocess.TimeoutExpired:
+                        console.print(f"\n[yellow]⚠ Execution timed out after {timeout} seconds[/yellow]")
+                        _kill_process_group(process)
+                        stdout, stderr = process.communicate()
+                        result.timed_out = True
+                        result.errors.append(f"Execution timed out after {timeout} seconds")
+                        if capture_output:
+                            result.stdout = stdout or ""
+                            result.stderr = stderr or ""
+
+                    if log:
+                        log.write(f"\n--- STDOUT ---\n{result.stdout}\n".encode(errors='replace'))
+                        log.write(f"\n--- STDERR ---\n{result.stderr}\n".encode(errors='replace'))
+            except KeyboardInterrupt:
+                _kill_process_group(process)
+                raise
 
             result.exit_code = process.returncode
             result.success = (result.exit_code == 0) and not result.timed_out
 
+        except (FileNotFoundError, PermissionError) as e:
+            if args is not None and e.filename == args[0]:
+                # Without a shell a missing or non-executable program raises here;
+                # report it as the shell did (exit 127/126), so results and
+                # diagnoses do not depend on how the command was started
+                not_found = isinstance(e, FileNotFoundError)
+                result.exit_code = 127 if not_found else 126
+                message = f"{args[0]}: {'command not found' if not_found else 'Permission denied'}\n"
+                if capture_output:
+                    result.stderr = message
+                if log:
+                    log.write(f"\n--- STDERR ---\n{message}".encode(errors='replace'))
+                console.print(Text(message, style='red'), end='')
+            else:
+                error_msg = f"Execution failed: {str(e)}"
+                result.errors.append(error_msg)
+                logger.error(error_msg)
+
         except Exception as e:
             error_msg = f"Execution failed: {str(e)}"
             result.errors.append(error_msg)
             logger.error(error_msg)
 
         result.end_time = datetime.now()
-        result.execution_time = (result.end_time - result.start_time).total_seconds()
+        result.execution_time = time.monotonic() - start
 
-        # Write log file
-        try:
-            with open(log_file, 'w') as f:
-                f.write(f"Command: {command}\n")
-                f.write(f"Exit code: {result.exit_code}\n")
-                f.write(f"Execution time: {result.execution_time:.2f}s\n")
-                f.write(f"\n--- STDOUT ---\n{result.stdout}\n")
-                f.write(f"\n--- STDERR ---\n{result.stderr}\n")
+        # Finish log file
+        if log:
+            try:
+                log.write(f"\nExit code: {result.exit_code}\n".encode())
+                log.write(f"Execution time: {result.execution_time:.2f}s\n".encode())
+                log.close()
 
-            console.print(f"\n[dim]Log saved to: {log_file}[/dim]")
+                console.print(f"\n[dim]Log saved to: {log_file}[/dim]")
 
-        except Exception as e:
-            logger.warning(f"Failed to write log file: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to write log file: {e}")
 
         # Display result
         if result.success:
@@ -218,6 +354,70 @@ class CodeExecutor:
 
         return result
 
+    def _stream_output(
+        self,
+        process: subprocess.Popen,
+        timeout: Optional[int],
+        log: Optional[BinaryIO] = None
+    ) -> Tuple[str, str, bool]:
+        """
+        Echo a process's stdout and stderr to the console as they arrive
+
+        Both pipes are multiplexed on one selector in the calling thread, and
+        output is printed in the chunks it is read in rather than line by line.
+        Raw output is written straight to the log, and only the last
+        OUTPUT_TAIL_BYTES of each stream are kept in memory.
+
+        Args:
+            process: Process started with stdout and stderr pipes
+            timeout: Timeout in seconds (None for no timeout)
+            log: Binary file receiving both streams as they arrive
+
+        Returns:
+            Tuple of (stdout tail, stderr tail, timed_out)
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        streams = {
+            process.stdout: (bytearray(), codecs.getincrementaldecoder('utf-8')(errors='replace'), None),
+            process.stderr: (bytearray(), codecs.getincrementaldecoder('utf-8')(errors='replace'), 'red'),
+        }
+        timed_out = False
+
+        with selectors.DefaultSelector() as selector:
+            for stream in streams:
+                selector.register(stream, selectors.EVENT_READ)
+
+            while selector.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    _kill_process_group(process)
+                    timed_out = True
+                    break
+
+                for key, _ in selector.select(timeout=remaining):
+                    data = os.read(key.fd, self.READ_CHUNK_SIZE)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                        continue
+
+                    if log:
+                        log.write(data)
+
+                    tail, decoder, style = streams[key.fileobj]
+                    tail.extend(data)
+                    if len(tail) > 2 * self.OUTPUT_TAIL_BYTES:
+                        del tail[:-self.OUTPUT_TAIL_BYTES]
+
+                    console.print(Text(decoder.decode(data), style=style or ''), end='')
+
+        process.wait()
+
+        stdout, stderr = (
+            tail[-self.OUTPUT_TAIL_BYTES:].decode('utf-8', errors='replace')
+            for tail, _, _ in streams.values()
+        )
+        return stdout, stderr, timed_out
+
     def execute_docker(
         self,
         command: str,
@@ -246,12 +446,9 @@ class CodeExecutor:
             docker_cmd += f" -v {mount_data}:/data"
 
         # Add GPU support if nvidia-docker is available
-        try:
-            subprocess.run(['nvidia-smi'], check=True, capture_output=True)
+        if _nvidia_gpu_available():
             docker_cmd += " --gpus all"
             console.print("[green]✓[/green] GPU support enabled")
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            pass
 
         docker_cmd += f" -w /workspace {image_name} {command}"
 
@@ -286,50 +483,17 @@ class CodeExecutor:
 
     def _analyze_errors(self, stderr: str) -> List[str]:
         """Extract and analyze errors from stderr"""
-        errors = []
-
         if not stderr:
-            return errors
-
-        lines = stderr.split('\n')
-
-        # Common error patterns
-        error_patterns = [
-            'Error:',
-            'ERROR:',
-            'Exception:',
-            'Traceback',
-            'FAILED',
-            'ImportError',
-            'ModuleNotFoundError',
-            'FileNotFoundError',
-            'RuntimeError',
-            'ValueError',
-            'TypeError',
-        ]
-
-        for line in lines:
-            for pattern in error_patterns:
-                if pattern in line:
-                    errors.append(line.strip())
-                    break
+            return []
 
-        return list(set(errors))  # Deduplicate
+        return _matching_lines(stderr, _ERROR_RE)
 
     def _analyze_warnings(self, stderr: str) -> List[str]:
         """Extract warnings from stderr"""
-        warnings = []
-
         if not stderr:
-            return warnings
-
-        lines = stderr.split('\n')
-
-        for line in lines:
-            if 'Warning:' in line or 'WARNING:' in line:
-                warnings.append(line.strip())
+            return []
 
-        return list(set(warnings))
+        return _matching_lines(stderr, _WARNING_RE)
 
     def cleanup(self):
         """Cleanup resources"""
@@ -2,33 +2,138 @@
 GPU Detection and Management Utilities
 """
 
+import atexit
+import functools
+import importlib.util
 import logging
 import subprocess
 import re
-from typing import List, Dict, Optional
+import shutil
+import time
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
 
 logger = logging.getLogger(__name__)
 
+# None until NVML initialization has been attempted, then whether it succeeded
+_nvml_initialized = None
+
+# Seconds a detect_gpus() result is reused; only free memory changes meanwhile
+GPU_INFO_TTL = 2.0
+_gpu_cache = None  # (monotonic timestamp, gpus)
+
+# Matched against nvidia-smi's raw output, which is never decoded
+_CUDA_VERSION_RE = re.compile(rb'CUDA Version:\s*(\d+\.\d+)')
+
+
+def _init_nvml() -> bool:
+    """Initialize NVML once per process; False if pynvml or the driver is missing"""
+    global _nvml_initialized
+
+    if _nvml_initialized is None:
+        _nvml_initialized = False
+        if pynvml is not None:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                _nvml_initialized = True
+            except pynvml.NVMLError as e:
+                logger.debug(f"NVML initialization failed: {e}")
+
+    return _nvml_initialized
+
 
 def detect_gpus() -> List[Dict]:
     """
-    Detect available GPUs using nvidia-smi
+    Detect available GPUs using NVML, or nvidia-smi if NVML is unavailable
 
     Returns:
         List of GPU info dicts with keys: name, memory_total, memory_free, index
     """
+    global _gpu_cache
+
+    now = time.monotonic()
+    if _gpu_cache is None or now - _gpu_cache[0] >= GPU_INFO_TTL:
+        gpus = _detect_gpus_nvml() if _init_nvml() else _detect_gpus_nvidia_smi()
+        _gpu_cache = (now, gpus)
+
+    # Copies, so callers can't modify the cached entries
+    return [dict(gpu) for gpu in _gpu_cache[1]]
+
+
+@functools.lru_cache(maxsize=1)
+def _nvml_devices() -> Tuple[Tuple, ...]:
+    """Static (index, handle, name, total MB) of each NVML device, queried once"""
+    devices = []
+
+    for index in range(pynvml.nvmlDeviceGetCount()):
+        handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+        name = pynvml.nvmlDeviceGetName(handle)
+        total_mb = pynvml.nvmlDeviceGetMemoryInfo(handle).total >> 20
+
+        devices.append((index, handle, name.decode() if isinstance(name, bytes) else name, total_mb))
+
+    logger.info(f"Detected {len(devices)} GPU(s)")
+    return tuple(devices)
+
+
+def _detect_gpus_nvml() -> List[Dict]:
+    """Query GPUs in-process through NVML"""
+    gpus = []
+
+    try:
+        for index, handle, name, total_mb in _nvml_devices():
+            gpus.append({
+                'index': index,
+                'name': name,
+                'memory_total_mb': total_mb,
+                'memory_free_mb': pynvml.nvmlDeviceGetMemoryInfo(handle).free >> 20,
+            })
+
+    except pynvml.NVMLError as e:
+        logger.debug(f"GPU detection failed: {e}")
+
+    return gpus
+
+
+@functools.lru_cache(maxsize=1)
+def _nvidia_smi_path() -> Optional[str]:
+    """Absolute path of nvidia-smi, looked up on PATH once"""
+    return shutil.which('nvidia-smi')
+
+
+def _run_nvidia_smi(*args: str) -> subprocess.CompletedProcess:
+    """
+    Run nvidia-smi and capture its output as bytes
+
+    The absolute path together with close_fds=False lets subprocess start
+    the child with posix_spawn instead of fork + exec. Python's own file
+    descriptors are non-inheritable, so none leak into the child.
+
+    Raises:
+        FileNotFoundError: If nvidia-smi is not on PATH
+        subprocess.TimeoutExpired: If it runs longer than 5 seconds
+    """
+    path = _nvidia_smi_path()
+    if path is None:
+        raise FileNotFoundError('nvidia-smi')
+
+    return subprocess.run([path, *args], capture_output=True, close_fds=False, timeout=5)
+
+
+def _detect_gpus_nvidia_smi() -> List[Dict]:
+    """Query GPUs by parsing nvidia-smi CSV output"""
     gpus = []
 
     try:
-        result = subprocess.run(
-            ['nvidia-smi', '--query-gpu=index,name,memory.total,memory.free', '--format=csv,noheader,nounits'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = _run_nvidia_smi('--query-gpu=index,name,memory.total,memory.free', '--format=csv,noheader,nounits')
 
         if result.returncode == 0:
-            for line in result.stdout.strip().split('\n'):
+            for line in result.stdout.decode('utf-8', errors='replace').strip().split('\n'):
                 if line.strip():
                     parts = [p.strip() for p in line.split(',')]
                     if len(parts) >= 4:
@@ -63,8 +168,11 @@ def get_gpu_memory() -> Dict[str, int]:
     Returns:
         Dict with 'total_mb' and 'free_mb' keys (sum across all GPUs)
     """
-    gpus = detect_gpus()
+    return _sum_memory(detect_gpus())
+
 
+def _sum_memory(gpus: List[Dict]) -> Dict[str, int]:
+    """Total and free memory summed over already detected GPUs"""
     if not gpus:
         return {'total_mb': 0, 'free_mb': 0}
 
@@ -137,38 +245,46 @@ def recommend_batch_size(model_params_millions: float, max_batch_size: int = 32)
     if memory['free_mb'] == 0:
         return 1  # CPU fallback
 
-    # Binary search for largest batch size that fits
-    left, right = 1, max_batch_size
-    best = 1
+    if model_params_millions <= 0:
+        return max_batch_size
 
-    while left <= right:
-        mid = (left + right) // 2
-        needed = estimate_gpu_memory_needed(model_params_millions, mid)
+    # estimate_gpu_memory_needed() is affine in batch size, so solve it for
+    # the largest batch that fits instead of searching
+    params_mb = model_params_millions * 4
+    best = int(((memory['free_mb'] + 1) / 1.2 - params_mb * 3) / (params_mb * 0.5))
+    best = max(1, min(best, max_batch_size))
 
-        if needed <= memory['free_mb']:
-            best = mid
-            left = mid + 1
-        else:
-            right = mid - 1
+    # Correct for float rounding at the boundary
+    if best > 1 and estimate_gpu_memory_needed(model_params_millions, best) > memory['free_mb']:
+        best -= 1
+    elif best < max_batch_size and estimate_gpu_memory_needed(model_params_millions, best + 1) <= memory['free_mb']:
+        best += 1
 
     return best
 
 
+@functools.lru_cache(maxsize=1)
 def get_cuda_version() -> Optional[str]:
     """Get CUDA version if available"""
+    if _init_nvml():
+        try:
+            version = pynvml.nvmlSystemGetCudaDriverVersion()
+            return f"{version // 1000}.{(version % 1000) // 10}"
+        except pynvml.NVMLError as e:
+            logger.debug(f"Failed to get CUDA version: {e}")
+            return None
+
+    if not has_nvidia_smi():
+        return None
+
     try:
-        result = subprocess.run(
-            ['nvidia-smi'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = _run_nvidia_smi()
 
         if result.returncode == 0:
             # Parse CUDA version from nvidia-smi output
-            match = re.search(r'CUDA Version:\s*(\d+\.\d+)', result.stdout)
+            match = _CUDA_VERSION_RE.search(result.stdout)
             if match:
-                return match.group(1)
+                return match.group(1).decode()
 
     except Exception as e:
         logger.debug(f"Failed to get CUDA version: {e}")
@@ -184,7 +300,7 @@ def get_gpu_requirements_summary() -> Dict:
         Dict with GPU availability, memory, CUDA version, etc.
     """
     gpus = detect_gpus()
-    memory = get_gpu_memory()
+    memory = _sum_memory(gpus)
     cuda_version = get_cuda_version()
 
     return {
@@ -198,17 +314,19 @@ def get_gpu_requirements_summary() -> Dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def has_nvidia_smi() -> bool:
     """Check if nvidia-smi is available"""
-    try:
-        subprocess.run(['nvidia-smi'], capture_output=True, timeout=5)
-        return True
-    except:
-        return False
+    return _nvidia_smi_path() is not None
 
 
+@functools.lru_cache(maxsize=1)
 def check_pytorch_cuda() -> bool:
     """Check if PyTorch can access CUDA"""
+    # Only import torch (which takes seconds) if it is installed at all
+    if importlib.util.find_spec('torch') is None:
+        return False
+
     try:
         import torch
         return torch.cuda.is_available()
@@ -216,8 +334,12 @@ def check_pytorch_cuda() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_tensorflow_gpu() -> bool:
     """Check if TensorFlow can access GPU"""
+    if importlib.util.find_spec('tensorflow') is None:
+        return False
+
     try:
         import tensorflow as tf
         return len(tf.config.list_physical_devices('GPU')) > 0
@@ -237,3 +359,49 @@ def get_ml_framework_gpu_status() -> Dict:
         'tensorflow_gpu': check_tensorflow_gpu(),
         'nvidia_gpus_detected': has_gpu(),
     }
+
+
+def print_gpu_status(console) -> None:
+    """
+    Print GPU availability and status
+
+    Shared by the ``gpu`` command and the console script's fast path, which
+    renders it without importing the rest of the CLI.
+
+    Args:
+        console: Rich console to print to
+    """
+    from rich.table import Table
+
+    console.print("\n[bold cyan]GPU Status[/bold cyan]\n")
+
+    gpu_info = get_gpu_requirements_summary()
+
+    if gpu_info['gpu_available']:
+        console.print(f"[green]✓[/green] {gpu_info['gpu_count']} GPU(s) available")
+        console.print(f"Total Memory: {gpu_info['total_memory_gb']} GB")
+        console.print(f"Free Memory: {gpu_info['free_memory_gb']} GB")
+
+        if gpu_info['cuda_version']:
+            console.print(f"CUDA Version: {gpu_info['cuda_version']}")
+
+        if gpu_info['gpus']:
+            console.print("\n[bold]GPUs:[/bold]")
+            table = Table(show_header=True)
+            table.add_column("Index", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Memory", style="yellow")
+
+            for gpu in gpu_info['gpus']:
+                table.add_row(
+                    str(gpu['index']),
+                    gpu['name'],
+                    f"{gpu['memory_total_mb']} MB"
+                )
+
+            console.print(table)
+    else:
+        console.print("[yellow]⚠[/yellow] No GPU detected")
+        console.print("\nML papers may fail or run slowly without GPU.")
+        console.print("Consider using cloud GPU services (Colab, Paperspace, etc.)")
+
@@ -6,13 +6,8 @@ Asks intelligent questions to gather missing information
 import logging
 from typing import Any, Dict, List, Optional
 
-try:
-    import inquirer
-    from inquirer import errors
-except ImportError:
-    inquirer = None
-
 from rich.console import Console
+from rich.markup import escape
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 
@@ -23,6 +18,10 @@ console = Console()
 class InteractiveSession:
     """Handle interactive questions and user input"""
 
+    # Longer listings are printed as plain rows; rich measures every cell of a
+    # Table before drawing it
+    MAX_TABLE_ROWS = 20
+
     def __init__(self, analysis: Dict, paper_metadata: Dict):
         """
         Args:
@@ -78,21 +77,18 @@ class InteractiveSession:
         # Multiple repos found
         console.print(f"\n[yellow]![/yellow] Found {len(repos)} repositories:")
 
-        table = Table(show_header=True)
-        table.add_column("#", style="cyan")
-        table.add_column("Repository", style="green")
-        table.add_column("Stars", justify="right")
-        table.add_column("Source", style="yellow")
-
-        for idx, repo in enumerate(repos, 1):
-            table.add_row(
-                str(idx),
-                repo['url'],
-                str(repo.get('stars', 'N/A')),
-                repo.get('source', 'unknown')
-            )
-
-        console.print(table)
+        self._print_rows(
+            [
+                {'header': "#", 'style': "cyan"},
+                {'header': "Repository", 'style': "green"},
+                {'header': "Stars", 'justify': "right"},
+                {'header': "Source", 'style': "yellow"},
+            ],
+            [
+                (str(idx), repo['url'], str(repo.get('stars', 'N/A')), repo.get('source', 'unknown'))
+                for idx, repo in enumerate(repos, 1)
+            ]
+        )
 
         while True:
             choice = Prompt.ask(
@@ -276,20 +272,41 @@ class InteractiveSession:
         """Display summary of collected configuration"""
         console.print("\n[bold cyan]Configuration Summary[/bold cyan]")
 
-        table = Table(show_header=True)
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="green")
-
+        rows = []
         for key, value in self.user_config.items():
             if isinstance(value, dict):
                 value = value.get('url', str(value))
-            table.add_row(key.replace('_', ' ').title(), str(value))
+            rows.append((key.replace('_', ' ').title(), str(value)))
 
-        console.print(table)
+        self._print_rows([{'header': "Setting", 'style': "cyan"}, {'header': "Value", 'style': "green"}], rows)
 
         proceed = Confirm.ask("\nProceed with these settings?", default=True)
         return proceed
 
+    def _print_rows(self, columns: List[Dict], rows: List[tuple]):
+        """
+        Print rows as a table, or line by line if there are too many
+
+        Args:
+            columns: Table.add_column() keyword arguments for each column
+            rows: Tuples of cell strings, one per column
+        """
+        if len(rows) <= self.MAX_TABLE_ROWS:
+            table = Table(show_header=True)
+            for column in columns:
+                table.add_column(**column)
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
+            return
+
+        styles = [column.get('style') for column in columns]
+        for row in rows:
+            console.print("  ".join(
+                f"[{style}]{escape(cell)}[/{style}]" if style else escape(cell)
+                for style, cell in zip(styles, row)
+            ))
+
     def ask_simple_question(
         self,
         question: str,
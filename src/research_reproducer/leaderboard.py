@@ -3,40 +3,328 @@ Reproducibility Leaderboard
 Track which papers are successfully reproduced
 """
 
+import atexit
 import json
 import logging
+import os
+import tempfile
+import time
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on Windows; instances there must not share a file
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Live leaderboards, compacted at exit. Held weakly so instances can be freed.
+_open_leaderboards = weakref.WeakSet()
+
+
+def _flush_open_leaderboards():
+    """Compact the attempt log of every leaderboard still alive at exit"""
+    for leaderboard in list(_open_leaderboards):
+        leaderboard.flush()
+
+
+atexit.register(_flush_open_leaderboards)
+
+
+def _loads(raw: bytes):
+    """Parse JSON with orjson when available"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data, default=None) -> bytes:
+    """Serialize compact JSON with orjson when available"""
+    if orjson:
+        return orjson.dumps(data, default=default)
+    return json.dumps(data, separators=(',', ':'), default=default).encode('utf-8')
+
 
 class ReproducibilityLeaderboard:
     """Track and rank papers by reproducibility"""
 
+    # New attempts are appended to a log; the full JSON is rewritten only
+    # after this many of them, and at exit
+    COMPACT_EVERY = 100
+
+    # Number of most recent attempts the consistency score looks at
+    CONSISTENCY_WINDOW = 5
+
+    # Setup complexity points; lower complexity scores higher
+    COMPLEXITY_SCORES = {'low': 10, 'medium': 6, 'high': 2}
+
+    # shields.io badge URL per reproducibility bucket; formatted with the score
+    BADGE_URLS = {
+        'highly_reproducible': "https://img.shields.io/badge/Reproducibility-{}%25-brightgreen?style=flat-square&logo=github",
+        'moderately_reproducible': "https://img.shields.io/badge/Reproducibility-{}%25-yellow?style=flat-square&logo=github",
+        'low_reproducible': "https://img.shields.io/badge/Reproducibility-{}%25-red?style=flat-square&logo=github",
+    }
+
     def __init__(self, db_path: str = './.cache/leaderboard.json'):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.db_path.with_suffix('.log.jsonl')
+
+        # Unbuffered: each attempt reaches the file in a single write
+        self._log = open(self.log_path, 'ab', buffering=0)
+
+        with self._log_lock(exclusive=False):
+            # Replayed attempts count as pending, so the next flush compacts them
+            self._pending = self._load_state()
+
+        _open_leaderboards.add(self)
+
+    @contextmanager
+    def _log_lock(self, exclusive: bool):
+        """
+        Hold an advisory lock on the attempt log
+
+        Appends and loads take a shared lock and compaction an exclusive one,
+        so instances on the same file (in this or another process) never
+        truncate attempts the others have logged but not yet compacted.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        fcntl.flock(self._log.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._log.fileno(), fcntl.LOCK_UN)
+
+    def _load_state(self) -> int:
+        """
+        Load the JSON, rebuild derived state and replay the attempt log
+
+        Returns:
+            Number of attempts replayed
+        """
         self.data = self._load()
+        self._rebuild_stats()
+        self._build_ranking()
+        return self._replay_log()
 
     def _load(self) -> Dict:
-        """Load leaderboard data"""
-        if self.db_path.exists():
-            try:
-                with open(self.db_path) as f:
-                    return json.load(f)
-            except:
-                pass
-        return {'papers': {}, 'stats': {}}
-
-    def _save(self):
-        """Save leaderboard data"""
+        """
+        Load leaderboard data
+
+        A file that cannot be parsed is moved aside to <name>.corrupt-<time>
+        and reported, instead of being silently replaced by an empty board.
+        """
+        try:
+            with open(self.db_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return {'papers': {}, 'stats': {}}
+
+        try:
+            return self._upgrade_data(_loads(raw))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            backup = self.db_path.with_name(f"{self.db_path.name}.corrupt-{int(time.time())}")
+            os.replace(self.db_path, backup)
+            logger.error(f"Leaderboard {self.db_path} is unreadable ({e}); moved it to {backup}")
+            return {'papers': {}, 'stats': {}}
+
+    @staticmethod
+    def _upgrade_data(data: Dict) -> Dict:
+        """Bring data saved by older versions up to the current format"""
+        for paper in data['papers'].values():
+            if paper['attempts'] and 'timestamp' in paper['attempts'][0]:
+                for attempt in paper['attempts']:
+                    ReproducibilityLeaderboard._upgrade_timestamp(attempt)
+
+            if 'n_attempts' not in paper:
+                times = [a['execution_time'] for a in paper['attempts'] if a['execution_time']]
+                paper['n_attempts'] = len(paper['attempts'])
+                paper['n_success'] = sum(1 for a in paper['attempts'] if a['success'])
+                paper['sum_time'] = sum(times)
+                paper['n_timed'] = len(times)
+
+            if 'recent_mask' not in paper:
+                paper['recent_mask'] = 0
+                for attempt in paper['attempts'][-ReproducibilityLeaderboard.CONSISTENCY_WINDOW:]:
+                    paper['recent_mask'] = (paper['recent_mask'] << 1) | bool(attempt['success'])
+
+        return data
+
+    @staticmethod
+    def _upgrade_timestamp(attempt: Dict):
+        """Replace an ISO 'timestamp' string with a UNIX 'ts' float"""
         try:
-            with open(self.db_path, 'w') as f:
-                json.dump(self.data, f, indent=2, default=str)
+            attempt['ts'] = datetime.fromisoformat(attempt['timestamp']).timestamp()
+            del attempt['timestamp']
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def _bucket(score: float) -> str:
+        """Stats key of the reproducibility bucket a score falls in"""
+        if score >= 80:
+            return 'highly_reproducible'
+        if score >= 50:
+            return 'moderately_reproducible'
+        return 'low_reproducible'
+
+    def _rebuild_stats(self):
+        """Recount global statistics from the per-paper counters"""
+        papers = self.data['papers'].values()
+
+        stats = {
+            'total_papers': len(papers),
+            'total_attempts': 0,
+            'successful_reproductions': 0,
+            'avg_success_rate': 0,
+            'highly_reproducible': 0,
+            'moderately_reproducible': 0,
+            'low_reproducible': 0,
+        }
+        # Running sum behind avg_success_rate
+        success_rate_sum = 0
+
+        for paper in papers:
+            stats['total_attempts'] += paper['n_attempts']
+            stats['successful_reproductions'] += paper['n_success']
+            success_rate_sum += paper['success_rate']
+            stats[self._bucket(paper['reproducibility_score'])] += 1
+
+        self._success_rate_sum = success_rate_sum
+        self.data['stats'] = stats
+        self._update_global_stats()
+
+    def _build_ranking(self):
+        """
+        Rank papers for get_top_papers()
+
+        The ranking holds (-score, insertion index, paper_id) keys, so ties
+        keep the order papers were first added in, as a stable sort would.
+        Without sortedcontainers, get_top_papers() sorts on every call.
+        """
+        self._rank_keys = {}
+        self._ranked = SortedList() if SortedList else None
+
+        for paper_id, paper in self.data['papers'].items():
+            self._update_ranking(paper_id, paper['reproducibility_score'])
+
+    def _update_ranking(self, paper_id: str, score: float):
+        """Move a paper to its position for a new score"""
+        if self._ranked is None:
+            return
+
+        old_key = self._rank_keys.get(paper_id)
+        if old_key is not None:
+            self._ranked.remove(old_key)
+            index = old_key[1]
+        else:
+            index = len(self._rank_keys)
+
+        new_key = self._rank_keys[paper_id] = (-score, index, paper_id)
+        self._ranked.add(new_key)
+
+    def _replay_log(self) -> int:
+        """
+        Apply attempts logged since the JSON was last written
+
+        Returns:
+            Number of attempts replayed
+        """
+        if not self.log_path.exists():
+            return 0
+
+        replayed = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    # Partial line from an interrupted write
+                    continue
+
+                paper_id = entry.pop('paper_id')
+                title = entry.pop('title', None)
+                authors = entry.pop('authors', [])
+                self._upgrade_timestamp(entry)
+                self._record_attempt(paper_id, entry, title, authors)
+                replayed += 1
+
+        if replayed:
+            logger.debug(f"Replayed {replayed} leaderboard attempt(s) from {self.log_path}")
+            self._update_global_stats()
+
+        return replayed
+
+    def _save(self) -> bool:
+        """
+        Save leaderboard data
+
+        The JSON is written to a temporary file and renamed over the old one,
+        so a crash mid-save leaves the previous version intact.
+
+        Returns:
+            True if the file was written
+        """
+        try:
+            # Same fallback as the log, so a value the log accepted (a Path, a
+            # datetime, ...) cannot make every later compaction fail
+            raw = _dumps(self.data, default=str)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.db_path.parent, prefix=f'.{self.db_path.name}.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(raw)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.db_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            return True
         except Exception as e:
             logger.error(f"Failed to save leaderboard: {e}")
+            return False
+
+    def flush(self):
+        """
+        Write the full leaderboard JSON and clear the attempt log
+
+        Other instances may have logged attempts to the same file, so the JSON
+        and the log are re-read under an exclusive lock and compacted together.
+        """
+        if self._pending == 0 or self._log.closed:
+            return
+
+        with self._log_lock(exclusive=True):
+            self._load_state()
+
+            # Keep the log if the JSON could not be written
+            if not self._save():
+                return
+
+            self._log.seek(0)
+            self._log.truncate()
+
+        self._pending = 0
 
     def add_result(self, paper_id: str, result: Dict):
         """
@@ -46,40 +334,88 @@ class ReproducibilityLeaderboard:
             paper_id: Paper identifier (arXiv ID, etc.)
             result: Reproduction result dict
         """
+        attempt = {
+            'ts': time.time(),
+            'success': result.get('success', False),
+            'execution_time': result.get('execution', {}).get('execution_time', 0),
+            'complexity': result.get('analysis', {}).get('estimated_complexity'),
+            'environment': result.get('environment', {}).get('type'),
+        }
+
+        entry = {'paper_id': paper_id, **attempt}
         if paper_id not in self.data['papers']:
+            entry['title'] = result.get('paper', {}).get('title')
+            entry['authors'] = result.get('paper', {}).get('authors', [])
+
+        try:
+            with self._log_lock(exclusive=False):
+                self._log.write(_dumps(entry, default=str) + b'\n')
+        except Exception as e:
+            logger.error(f"Failed to log leaderboard attempt: {e}")
+
+        self._record_attempt(paper_id, attempt, entry.get('title'), entry.get('authors', []))
+        self._update_global_stats()
+
+        self._pending += 1
+        if self._pending >= self.COMPACT_EVERY:
+            self.flush()
+
+    def _record_attempt(self, paper_id: str, attempt: Dict, title: Optional[str], authors: List):
+        """Add an attempt to the in-memory data and update the paper's stats"""
+        stats = self.data['stats']
+
+        if paper_id not in self.data['papers']:
+            stats['total_papers'] += 1
+            stats['low_reproducible'] += 1
             self.data['papers'][paper_id] = {
-                'title': result.get('paper', {}).get('title'),
-                'authors': result.get('paper', {}).get('authors', []),
+                'title': title,
+                'authors': authors,
                 'attempts': [],
+                # Running totals, so stats don't rescan the attempts
+                'n_attempts': 0,
+                'n_success': 0,
+                'sum_time': 0,
+                'n_timed': 0,
+                # Bit i set if the (i+1)-th most recent attempt succeeded
+                'recent_mask': 0,
                 'success_rate': 0,
                 'avg_time': 0,
                 'reproducibility_score': 0,
             }
 
         paper = self.data['papers'][paper_id]
-
-        # Add attempt
-        attempt = {
-            'timestamp': datetime.now().isoformat(),
-            'success': result.get('success', False),
-            'execution_time': result.get('execution', {}).get('execution_time', 0),
-            'complexity': result.get('analysis', {}).get('estimated_complexity'),
-            'environment': result.get('environment', {}).get('type'),
-        }
         paper['attempts'].append(attempt)
+        old_rate = paper['success_rate']
+        old_bucket = self._bucket(paper['reproducibility_score'])
 
         # Update stats
-        successful = sum(1 for a in paper['attempts'] if a['success'])
-        paper['success_rate'] = (successful / len(paper['attempts'])) * 100
+        paper['n_attempts'] += 1
+        if attempt['success']:
+            paper['n_success'] += 1
+        if attempt['execution_time']:
+            paper['sum_time'] += attempt['execution_time']
+            paper['n_timed'] += 1
 
-        times = [a['execution_time'] for a in paper['attempts'] if a['execution_time']]
-        paper['avg_time'] = sum(times) / len(times) if times else 0
+        window = (1 << self.CONSISTENCY_WINDOW) - 1
+        paper['recent_mask'] = ((paper['recent_mask'] << 1) | bool(attempt['success'])) & window
+
+        paper['success_rate'] = (paper['n_success'] / paper['n_attempts']) * 100
+        paper['avg_time'] = paper['sum_time'] / paper['n_timed'] if paper['n_timed'] else 0
+
+        stats['total_attempts'] += 1
+        if attempt['success']:
+            stats['successful_reproductions'] += 1
+        self._success_rate_sum += paper['success_rate'] - old_rate
 
         # Calculate reproducibility score (0-100)
         paper['reproducibility_score'] = self._calculate_score(paper)
 
-        self._save()
-        self._update_global_stats()
+        new_bucket = self._bucket(paper['reproducibility_score'])
+        if new_bucket != old_bucket:
+            stats[old_bucket] -= 1
+            stats[new_bucket] += 1
+
+        self._update_ranking(paper_id, paper['reproducibility_score'])
 
     def _calculate_score(self, paper: Dict) -> float:
         """
@@ -91,54 +427,53 @@ class ReproducibilityLeaderboard:
         - Consistency (20%)
         - Setup complexity (10%)
         """
+        if not paper['n_attempts']:
+            return 0.0
+
         score = 0
 
         # Success rate (0-50 points)
         score += paper['success_rate'] * 0.5
 
         # Number of attempts (0-20 points)
-        attempts = len(paper['attempts'])
+        attempts = paper['n_attempts']
         score += min(attempts * 4, 20)  # Max at 5 attempts
 
         # Consistency (0-20 points)
-        recent_attempts = paper['attempts'][-5:]  # Last 5
-        if len(recent_attempts) >= 2:
-            recent_success = sum(1 for a in recent_attempts if a['success'])
-            consistency = (recent_success / len(recent_attempts)) * 20
+        recent_attempts = min(attempts, self.CONSISTENCY_WINDOW)
+        if recent_attempts >= 2:
+            recent_success = bin(paper['recent_mask']).count('1')
+            consistency = (recent_success / recent_attempts) * 20
             score += consistency
 
         # Setup complexity (0-10 points)
-        if paper.get('attempts'):
-            complexities = [a.get('complexity') for a in paper['attempts'] if a.get('complexity')]
-            if complexities:
-                # Lower complexity = higher score
-                complexity_map = {'low': 10, 'medium': 6, 'high': 2}
-                avg_complexity = complexity_map.get(complexities[-1], 5)
-                score += avg_complexity
+        latest_complexity = next(
+            (a['complexity'] for a in reversed(paper['attempts']) if a.get('complexity')),
+            None
+        )
+        if latest_complexity:
+            score += self.COMPLEXITY_SCORES.get(latest_complexity, 5)
 
         return min(score, 100)
 
     def _update_global_stats(self):
         """Update global statistics"""
-        papers = self.data['papers']
-
-        self.data['stats'] = {
-            'total_papers': len(papers),
-            'total_attempts': sum(len(p['attempts']) for p in papers.values()),
-            'successful_reproductions': sum(
-                sum(1 for a in p['attempts'] if a['success'])
-                for p in papers.values()
-            ),
-            'avg_success_rate': sum(p['success_rate'] for p in papers.values()) / len(papers) if papers else 0,
-            'highly_reproducible': sum(1 for p in papers.values() if p['reproducibility_score'] >= 80),
-            'moderately_reproducible': sum(1 for p in papers.values() if 50 <= p['reproducibility_score'] < 80),
-            'low_reproducible': sum(1 for p in papers.values() if p['reproducibility_score'] < 50),
-        }
-
-        self._save()
+        # Counts are kept current by _record_attempt(); only the average is derived
+        stats = self.data['stats']
+        stats['avg_success_rate'] = self._success_rate_sum / stats['total_papers'] if stats['total_papers'] else 0
 
     def get_top_papers(self, limit: int = 10) -> List[Dict]:
         """Get top reproducible papers"""
+        if self._ranked is not None:
+            papers = self.data['papers']
+            return [
+                {
+                    'paper_id': paper_id,
+                    **papers[paper_id]
+                }
+                for _, _, paper_id in self._ranked[:limit]
+            ]
+
         papers = [
             {
                 'paper_id': pid,
@@ -173,20 +508,11 @@ class ReproducibilityLeaderboard:
 
         score = paper['reproducibility_score']
 
-        # Determine color
-        if score >= 80:
-            color = 'brightgreen'
-            label = 'Highly Reproducible'
-        elif score >= 50:
-            color = 'yellow'
-            label = 'Moderately Reproducible'
-        else:
-            color = 'red'
-            label = 'Low Reproducibility'
-
-        badge_url = f"https://img.shields.io/badge/Reproducibility-{int(score)}%25-{color}?style=flat-square&logo=github"
+        return self.BADGE_URLS[self._bucket(score)].format(int(score))
 
-        return badge_url
+    def export_json(self) -> str:
+        """Export the leaderboard as indented JSON for reading or diffing"""
+        return json.dumps(self.data, indent=2, default=str)
 
     def export_markdown_table(self, limit: int = 20) -> str:
         """Export top papers as markdown table"""
@@ -5,12 +5,61 @@ Auto-generate Colab/Jupyter notebooks for reproducing papers
 
 import json
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# The code generators below take only the analysis fields they read, so
+# repeated notebooks for the same repository (preview, then save) reuse them
+
+@lru_cache(maxsize=32)
+def _setup_code(has_python: bool) -> str:
+    """Generate setup code"""
+    parts = ["# Install system dependencies\n"]
+
+    if has_python:
+        parts.append("# Upgrade pip\n!pip install --upgrade pip\n\n")
+
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=32)
+def _install_code(requirements_files: Tuple[str, ...], setup_py: bool, package_json: bool) -> str:
+    """Generate dependency installation code"""
+    # Python dependencies
+    parts = [f"# Install from {req_file}\n!pip install -r {req_file}\n\n" for req_file in requirements_files]
+
+    if setup_py:
+        parts.append("# Install from setup.py\n!pip install -e .\n\n")
+
+    # Node dependencies
+    if package_json:
+        parts.append("# Install Node.js dependencies\n!npm install\n\n")
+
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=32)
+def _run_code(has_entry_point: bool, command: Optional[str]) -> str:
+    """Generate code execution commands"""
+    parts = ["# Run reproduction\n\n"]
+
+    if has_entry_point:
+        parts.append(f"# Execute: {command}\n!{command}\n")
+    else:
+        parts.append("# No clear entry point found\n# Check the repository README for run instructions\n")
+
+    return ''.join(parts)
+
+
 class NotebookGenerator:
     """Generate executable notebooks for paper reproduction"""
 
@@ -28,56 +77,56 @@ class NotebookGenerator:
         Returns:
             Notebook dict (can be saved as .ipynb)
         """
-        cells = []
-
-        # Title cell
-        cells.append(self._markdown_cell(
-            f"# Reproducing: {analysis.get('paper_title', 'Research Paper')}\n\n"
-            f"Auto-generated notebook for reproducing this research paper.\n\n"
-            f"Repository: [{repo_url}]({repo_url})"
-        ))
-
-        # Setup cell
-        setup_code = self._generate_setup_code(analysis)
-        cells.append(self._code_cell(setup_code, "Setup Environment"))
-
-        # Clone repository
-        cells.append(self._code_cell(
-            f"# Clone repository\n"
-            f"!git clone {repo_url} repo\n"
-            f"%cd repo",
-            "Clone Repository"
-        ))
-
-        # Install dependencies
+        gpu_required = analysis.get('gpu_required')
         install_code = self._generate_install_code(analysis)
-        if install_code:
-            cells.append(self._code_cell(install_code, "Install Dependencies"))
-
-        # GPU check
-        if analysis.get('gpu_required'):
-            cells.append(self._markdown_cell(
-                "## ⚠️ GPU Required\n\n"
-                "This code requires GPU. Make sure you have enabled GPU in Colab:\n"
-                "- Runtime → Change runtime type → GPU"
-            ))
-            cells.append(self._code_cell(
-                "# Check GPU\n"
-                "!nvidia-smi",
-                "Verify GPU"
-            ))
-
-        # Data download
-        if analysis.get('data_requirements'):
-            cells.append(self._markdown_cell(
+        data_requirements = analysis.get('data_requirements')
+
+        cells = [
+            # Title cell
+            self._markdown_cell(
+                f"# Reproducing: {analysis.get('paper_title', 'Research Paper')}\n\n"
+                f"Auto-generated notebook for reproducing this research paper.\n\n"
+                f"Repository: [{repo_url}]({repo_url})"
+            ),
+
+            # Setup cell
+            self._code_cell(self._generate_setup_code(analysis), "Setup Environment"),
+
+            # Clone repository
+            self._code_cell(
+                f"# Clone repository\n"
+                f"!git clone {repo_url} repo\n"
+                f"%cd repo",
+                "Clone Repository"
+            ),
+
+            # Install dependencies
+            *([self._code_cell(install_code, "Install Dependencies")] if install_code else []),
+
+            # GPU check
+            *([
+                self._markdown_cell(
+                    "## ⚠️ GPU Required\n\n"
+                    "This code requires GPU. Make sure you have enabled GPU in Colab:\n"
+                    "- Runtime → Change runtime type → GPU"
+                ),
+                self._code_cell(
+                    "# Check GPU\n"
+                    "!nvidia-smi",
+                    "Verify GPU"
+                ),
+            ] if gpu_required else []),
+
+            # Data download
+            *([self._markdown_cell(
                 "## 📁 Data Requirements\n\n"
                 "This paper requires external data:\n" +
-                "\n".join(f"- {req}" for req in analysis['data_requirements'])
-            ))
+                "\n".join(f"- {req}" for req in data_requirements)
+            )] if data_requirements else []),
 
-        # Run code
-        run_code = self._generate_run_code(analysis)
-        cells.append(self._code_cell(run_code, "Run Reproduction"))
+            # Run code
+            self._code_cell(self._generate_run_code(analysis), "Run Reproduction"),
+        ]
 
         # Create notebook
         notebook = {
@@ -86,7 +135,7 @@ class NotebookGenerator:
             "metadata": {
                 "colab": {
                     "provenance": [],
-                    "gpuType": "T4" if analysis.get('gpu_required') else None,
+                    "gpuType": "T4" if gpu_required else None,
                 },
                 "kernelspec": {
                     "name": "python3",
@@ -95,7 +144,7 @@ class NotebookGenerator:
                 "language_info": {
                     "name": "python"
                 },
-                "accelerator": "GPU" if analysis.get('gpu_required') else None,
+                "accelerator": "GPU" if gpu_required else None,
             },
             "cells": cells
         }
@@ -125,66 +174,47 @@ class NotebookGenerator:
 
     def _generate_setup_code(self, analysis: Dict) -> str:
         """Generate setup code"""
-        code = "# Install system dependencies\n"
-
-        if 'Python' in analysis.get('languages', []):
-            code += "# Upgrade pip\n"
-            code += "!pip install --upgrade pip\n\n"
-
-        return code
+        return _setup_code('Python' in analysis.get('languages', []))
 
     def _generate_install_code(self, analysis: Dict) -> str:
         """Generate dependency installation code"""
-        code = ""
-
         deps = analysis.get('dependencies', {})
+        python_deps = deps.get('python') or {}
+        node_deps = deps.get('node') or {}
 
-        # Python dependencies
-        if 'python' in deps:
-            python_deps = deps['python']
-
-            if python_deps.get('requirements_files'):
-                for req_file in python_deps['requirements_files']:
-                    code += f"# Install from {req_file}\n"
-                    code += f"!pip install -r {req_file}\n\n"
-
-            if python_deps.get('setup_py'):
-                code += "# Install from setup.py\n"
-                code += "!pip install -e .\n\n"
-
-        # Node dependencies
-        if 'node' in deps and deps['node'].get('package_json'):
-            code += "# Install Node.js dependencies\n"
-            code += "!npm install\n\n"
-
-        return code
+        return _install_code(
+            tuple(python_deps.get('requirements_files') or ()),
+            bool(python_deps.get('setup_py')),
+            bool(node_deps.get('package_json')),
+        )
 
     def _generate_run_code(self, analysis: Dict) -> str:
         """Generate code execution commands"""
-        code = "# Run reproduction\n\n"
-
         entry_points = analysis.get('entry_points', [])
 
+        command = None
         if entry_points:
             # Use first entry point
             ep = entry_points[0]
             command = ep.get('command', ep.get('file', 'python main.py'))
 
-            code += f"# Execute: {command}\n"
-            code += f"!{command}\n"
-        else:
-            code += "# No clear entry point found\n"
-            code += "# Check the repository README for run instructions\n"
-
-        return code
+        return _run_code(bool(entry_points), command)
 
     def save_notebook(self, notebook: Dict, output_path: str):
         """Save notebook to file"""
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(notebook, f, indent=2)
+        if orjson:
+            raw = orjson.dumps(notebook, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(notebook, indent=2).encode('utf-8')
+
+        # Create the parent directory only if the write shows it is missing
+        try:
+            output_path.write_bytes(raw)
+        except FileNotFoundError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(raw)
 
         logger.info(f"Notebook saved to {output_path}")
 
@@ -5,30 +5,65 @@ Coordinates all modules to reproduce research papers
 
 import json
 import logging
-import shutil
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-import git
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .paper_ingestion import PaperIngestion
-from .repo_finder import RepositoryFinder
-from .repo_analyzer import RepositoryAnalyzer
-from .env_setup import EnvironmentSetup
-from .interactive import InteractiveSession
-from .executor import CodeExecutor
-from .cache import ReproducerCache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The pipeline modules (arxiv, pdfplumber, bs4, docker, ...) are imported where
+# each stage first needs them, so importing the orchestrator stays cheap
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+def _dump_json(data: Dict, indent: bool = True) -> bytes:
+    """Serialize a report or checkpoint entry as JSON, with orjson when available"""
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Dict:
+    """Parse JSON, with orjson when available"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ReproductionOrchestrator:
     """Main orchestrator for reproducing research papers"""
 
+    # Concurrent arXiv / GitHub lookups when reproducing a batch of papers
+    MAX_LOOKUP_WORKERS = 8
+
+    # Only the tip of the default branch is analyzed and run, so skip the history
+    CLONE_OPTIONS = ['--depth=1', '--single-branch']
+    # Fail instead of prompting for credentials, and leave Git LFS files as pointers
+    CLONE_ENV = {'GIT_TERMINAL_PROMPT': '0', 'GIT_LFS_SKIP_SMUDGE': '1'}
+
+    # Steps finishing sooner than this (cache hits, small PDFs) get no spinner
+    SPINNER_DELAY = 0.25  # seconds
+
+    # Larger stdout/stderr captures are cut to their last this-many bytes in
+    # report.json, next to a pointer to the executor's full log
+    REPORT_INLINE_OUTPUT_BYTES = 64 * 1024
+
     def __init__(self, work_dir: str = './reproductions', github_token: Optional[str] = None, use_cache: bool = True):
         """
         Args:
@@ -39,16 +74,35 @@ class ReproductionOrchestrator:
         self.work_dir = Path(work_dir)
         self.work_dir.mkdir(parents=True, exist_ok=True)
 
+        from .paper_ingestion import PaperIngestion
+        from .repo_finder import RepositoryFinder
+
         self.paper_ingestion = PaperIngestion()
         self.repo_finder = RepositoryFinder(github_token=github_token)
 
         # Initialize cache
         self.use_cache = use_cache
-        self.cache = ReproducerCache() if use_cache else None
+        if use_cache:
+            from .cache import ReproducerCache
+            self.cache = ReproducerCache()
+        else:
+            self.cache = None
+
+        # One spinner display, restarted for each step
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        )
 
         self.session_dir = None
         self.checkpoint_file = None
-        self.report = {
+        self.report = self._new_report()
+
+    @staticmethod
+    def _new_report() -> Dict:
+        """Create an empty reproduction report"""
+        return {
             'paper': {},
             'repositories': [],
             'analysis': {},
@@ -73,14 +127,8 @@ class ReproductionOrchestrator:
         console.print(f"Starting reproduction from PDF: {pdf_path}\n")
 
         # Extract paper metadata
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Extracting paper metadata...", total=None)
+        with self._progress_step("Extracting paper metadata..."):
             paper_metadata = self.paper_ingestion.extract_from_pdf(pdf_path)
-            progress.update(task, completed=True)
 
         self.report['paper'] = paper_metadata
 
@@ -111,18 +159,8 @@ class ReproductionOrchestrator:
 
         # Fetch paper metadata if not cached
         if not paper_metadata:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Fetching paper from arXiv...", total=None)
-                paper_metadata = self.paper_ingestion.extract_from_arxiv(arxiv_id)
-                progress.update(task, completed=True)
-
-            # Cache the result
-            if self.use_cache:
-                self.cache.set_paper_metadata(arxiv_id, paper_metadata)
+            with self._progress_step("Fetching paper from arXiv..."):
+                paper_metadata = self._fetch_arxiv_metadata(arxiv_id)
 
         self.report['paper'] = paper_metadata
 
@@ -130,6 +168,79 @@ class ReproductionOrchestrator:
 
         return self._reproduce_from_metadata(paper_metadata, **kwargs)
 
+    def reproduce_many(self, arxiv_ids: List[str], **kwargs) -> List[Dict]:
+        """
+        Reproduce several arXiv papers
+
+        Paper metadata and repository searches are network-bound and independent,
+        so they are looked up concurrently up front. Cloning, environment setup and
+        execution then run one paper at a time, since they share the console and
+        may prompt the user.
+
+        Args:
+            arxiv_ids: arXiv paper IDs
+            **kwargs: Additional options, as for reproduce_from_arxiv
+
+        Returns:
+            One reproduction report per paper, in the order given. A paper whose
+            lookup or reproduction raised gets a failed report with an 'error'.
+        """
+        arxiv_ids = list(dict.fromkeys(arxiv_ids))
+        if not arxiv_ids:
+            return []
+
+        console.print(f"\n[bold cyan]Research Reproducer[/bold cyan]")
+        console.print(f"Starting reproduction of {len(arxiv_ids)} arXiv papers\n")
+
+        # Each worker waits on its own arXiv fetch and then hands the repository
+        # strategies to the finder's shared pool, so the pools are not nested
+        max_workers = min(self.MAX_LOOKUP_WORKERS, len(arxiv_ids))
+        with self._progress_step(f"Looking up {len(arxiv_ids)} papers and their repositories..."):
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._lookup_arxiv_paper, arxiv_id) for arxiv_id in arxiv_ids]
+
+        reports = []
+        for arxiv_id, future in zip(arxiv_ids, futures):
+            self.report = self._new_report()
+
+            try:
+                paper_metadata, repos = future.result()
+                self.report['paper'] = paper_metadata
+
+                console.print(f"\n[green]✓[/green] Paper {arxiv_id}: {paper_metadata.get('title', 'Unknown')}")
+                reports.append(self._reproduce_from_metadata(paper_metadata, repos=repos, **kwargs))
+            except Exception as e:
+                logger.error(f"Reproduction of {arxiv_id} failed: {e}")
+                console.print(f"\n[red]✗ Paper {arxiv_id}: {e}[/red]")
+
+                if not self.report['paper']:
+                    self.report['paper'] = {'arxiv_id': arxiv_id}
+                self.report['success'] = False
+                self.report['error'] = str(e)
+                reports.append(self.report)
+
+        return reports
+
+    def _fetch_arxiv_metadata(self, arxiv_id: str) -> Dict:
+        """Fetch paper metadata from arXiv and cache it"""
+        paper_metadata = self.paper_ingestion.extract_from_arxiv(arxiv_id)
+
+        if self.use_cache:
+            self.cache.set_paper_metadata(arxiv_id, paper_metadata)
+
+        return paper_metadata
+
+    def _lookup_arxiv_paper(self, arxiv_id: str) -> Tuple[Dict, List[Dict]]:
+        """Get paper metadata (cached or fetched) and search for its repositories"""
+        paper_metadata = None
+        if self.use_cache:
+            paper_metadata = self.cache.get_paper_metadata(arxiv_id)
+
+        if not paper_metadata:
+            paper_metadata = self._fetch_arxiv_metadata(arxiv_id)
+
+        return paper_metadata, self.repo_finder.find_repositories(paper_metadata)
+
     def reproduce_from_url(self, url: str, **kwargs) -> Dict:
         """
         Reproduce research from URL
@@ -145,14 +256,8 @@ class ReproductionOrchestrator:
         console.print(f"Starting reproduction from URL: {url}\n")
 
         # Extract paper metadata
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Extracting paper metadata...", total=None)
+        with self._progress_step("Extracting paper metadata..."):
             paper_metadata = self.paper_ingestion.extract_from_url(url)
-            progress.update(task, completed=True)
 
         self.report['paper'] = paper_metadata
 
@@ -164,6 +269,7 @@ class ReproductionOrchestrator:
         interactive: bool = True,
         auto_install: bool = True,
         timeout: Optional[int] = None,
+        repos: Optional[List[Dict]] = None,
         **kwargs
     ) -> Dict:
         """
@@ -174,6 +280,7 @@ class ReproductionOrchestrator:
             interactive: Use interactive mode
             auto_install: Automatically install dependencies
             timeout: Execution timeout in seconds
+            repos: Repositories already found for the paper, skipping the search
             **kwargs: Additional options
 
         Returns:
@@ -185,8 +292,12 @@ class ReproductionOrchestrator:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         paper_name = paper_metadata.get('title', 'unknown')[:50].replace(' ', '_')
         self.session_dir = self.work_dir / f"{paper_name}_{timestamp}"
-        self.session_dir.mkdir(parents=True, exist_ok=True)
-        self.checkpoint_file = self.session_dir / '.checkpoint.json'
+        # work_dir was created in __init__, so normally only the session level is new
+        try:
+            self.session_dir.mkdir(exist_ok=True)
+        except FileNotFoundError:
+            self.session_dir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_file = self.session_dir / '.checkpoint.jsonl'
 
         console.print(f"[dim]Session directory: {self.session_dir}[/dim]\n")
 
@@ -195,14 +306,9 @@ class ReproductionOrchestrator:
 
         # Step 1: Find repositories
         console.print("[bold]Step 1: Finding repositories[/bold]")
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Searching for code repositories...", total=None)
-            repos = self.repo_finder.find_repositories(paper_metadata)
-            progress.update(task, completed=True)
+        if repos is None:
+            with self._progress_step("Searching for code repositories..."):
+                repos = self.repo_finder.find_repositories(paper_metadata)
 
         if not repos:
             console.print("[red]✗ No repositories found[/red]")
@@ -218,6 +324,8 @@ class ReproductionOrchestrator:
         user_config = {}
 
         if interactive:
+            from .interactive import InteractiveSession
+
             session = InteractiveSession(analysis={}, paper_metadata=paper_metadata)
             session.user_config['available_repos'] = repos
 
@@ -235,33 +343,26 @@ class ReproductionOrchestrator:
         console.print(f"\n[bold]Step 2: Cloning repository[/bold]")
         repo_path = self.session_dir / 'repo'
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Cloning {selected_repo['url']}...", total=None)
+        with self._progress_step(f"Cloning {selected_repo['url']}..."):
             try:
-                git.Repo.clone_from(selected_repo['url'], repo_path)
-                progress.update(task, completed=True)
+                self._clone_repository(selected_repo['url'], repo_path)
                 console.print(f"[green]✓[/green] Repository cloned")
             except Exception as e:
                 console.print(f"[red]✗ Failed to clone repository: {e}[/red]")
                 self.report['success'] = False
                 return self.report
 
+        if self._uses_git_lfs(repo_path):
+            console.print(f"[dim]Git LFS files were not downloaded; run 'git lfs pull' in {repo_path} if needed[/dim]")
+
         # Step 3: Analyze repository
         console.print(f"\n[bold]Step 3: Analyzing repository[/bold]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Analyzing code structure...", total=None)
+        with self._progress_step("Analyzing code structure..."):
+            from .repo_analyzer import RepositoryAnalyzer
+
             analyzer = RepositoryAnalyzer(repo_path)
             analysis = analyzer.analyze()
-            progress.update(task, completed=True)
 
         self.report['analysis'] = analysis
 
@@ -283,6 +384,8 @@ class ReproductionOrchestrator:
         # Step 4: Setup environment
         console.print(f"\n[bold]Step 4: Setting up environment[/bold]")
 
+        from .env_setup import EnvironmentSetup
+
         env_setup = EnvironmentSetup(self.session_dir / 'envs')
 
         if interactive and user_config.get('env_type'):
@@ -313,6 +416,8 @@ class ReproductionOrchestrator:
         # Step 5: Execute code
         console.print(f"\n[bold]Step 5: Executing code[/bold]")
 
+        from .executor import CodeExecutor
+
         executor = CodeExecutor(repo_path, env_info, self.session_dir / 'logs')
 
         # Determine what to run
@@ -350,13 +455,92 @@ class ReproductionOrchestrator:
 
         return self.report
 
+    def _clone_repository(self, url: str, repo_path: Path):
+        """
+        Clone a repository with the git CLI
+
+        Raises:
+            RuntimeError: If git clone fails (message is git's stderr)
+        """
+        result = subprocess.run(
+            ['git', '-c', 'protocol.version=2', 'clone', *self.CLONE_OPTIONS, '--', url, str(repo_path)],
+            capture_output=True,
+            env={**os.environ, **self.CLONE_ENV},
+        )
+
+        if result.returncode != 0:
+            message = result.stderr.decode('utf-8', errors='replace').strip()
+            raise RuntimeError(message or f"git clone exited with status {result.returncode}")
+
+    @staticmethod
+    def _uses_git_lfs(repo_path: Path) -> bool:
+        """Check whether a cloned repository tracks files with Git LFS"""
+        try:
+            return 'filter=lfs' in (repo_path / '.gitattributes').read_text(errors='ignore')
+        except OSError:
+            return False
+
+    @contextmanager
+    def _progress_step(self, description: str):
+        """Show a spinner with the description if the block runs longer than SPINNER_DELAY"""
+        lock = threading.Lock()
+        state = {'task': None, 'done': False}
+
+        def show():
+            with lock:
+                if not state['done']:
+                    self._progress.start()
+                    state['task'] = self._progress.add_task(description, total=None)
+
+        timer = threading.Timer(self.SPINNER_DELAY, show)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
+            with lock:
+                state['done'] = True
+                if state['task'] is not None:
+                    # The last frame stays on screen; drop the task so the next
+                    # step starts with an empty display
+                    self._progress.stop()
+                    self._progress.remove_task(state['task'])
+
     def _save_report(self):
-        """Save reproduction report to file"""
+        """
+        Save reproduction report to file
+
+        The executor already streams the complete output to execution['log_file'],
+        so stdout/stderr captures larger than REPORT_INLINE_OUTPUT_BYTES are
+        replaced in the saved report by {'log_file': path, 'tail': text}, where
+        the tail is the last REPORT_INLINE_OUTPUT_BYTES of that stream. The
+        in-memory report keeps the captured text.
+        """
         report_path = self.session_dir / 'report.json'
 
         try:
-            with open(report_path, 'w') as f:
-                json.dump(self.report, f, indent=2, default=str)
+            report = self.report
+            execution = report.get('execution') or {}
+            log_file = execution.get('log_file')
+
+            if log_file:
+                for stream in ('stdout', 'stderr'):
+                    output = execution.get(stream)
+                    if not isinstance(output, str):
+                        continue
+                    encoded = output.encode('utf-8', errors='replace')
+                    if len(encoded) <= self.REPORT_INLINE_OUTPUT_BYTES:
+                        continue
+
+                    if report is self.report:
+                        report = {**self.report, 'execution': dict(execution)}
+                    # Dropping a partial character at the cut keeps the tail valid UTF-8
+                    tail = encoded[-self.REPORT_INLINE_OUTPUT_BYTES:].decode('utf-8', errors='ignore')
+                    report['execution'][stream] = {'log_file': log_file, 'tail': tail}
+
+            with open(report_path, 'wb') as f:
+                f.write(_dump_json(report))
 
             logger.info(f"Report saved to {report_path}")
 
@@ -364,42 +548,56 @@ class ReproductionOrchestrator:
             logger.error(f"Failed to save report: {e}")
 
     def _save_checkpoint(self, stage: str, data: Dict):
-        """Save checkpoint for resuming interrupted reproductions"""
+        """
+        Save checkpoint for resuming interrupted reproductions
+
+        Each stage is appended to the checkpoint file as one JSON line, so
+        earlier stages are never read back or rewritten.
+        """
         if not self.checkpoint_file:
             return
 
-        checkpoint = {}
-        if self.checkpoint_file.exists():
-            try:
-                with open(self.checkpoint_file) as f:
-                    checkpoint = json.load(f)
-            except:
-                pass
-
-        checkpoint[stage] = {
+        entry = {
+            'stage': stage,
             'timestamp': datetime.now().isoformat(),
             'data': data
         }
-        checkpoint['last_stage'] = stage
 
         try:
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(checkpoint, f, indent=2, default=str)
+            with open(self.checkpoint_file, 'ab') as f:
+                f.write(_dump_json(entry, indent=False) + b'\n')
         except Exception as e:
             logger.warning(f"Failed to save checkpoint: {e}")
 
     def _load_checkpoint(self) -> Dict:
-        """Load checkpoint if exists"""
+        """
+        Load checkpoint if exists
+
+        Returns:
+            Dict mapping each stage to its timestamp and data, plus 'last_stage'
+        """
         if not self.checkpoint_file or not self.checkpoint_file.exists():
             return {}
 
+        checkpoint = {}
         try:
-            with open(self.checkpoint_file) as f:
-                return json.load(f)
+            with open(self.checkpoint_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = _load_json(line)
+                    except ValueError:
+                        # Partial line from an interrupted write
+                        continue
+
+                    stage = entry.pop('stage')
+                    checkpoint[stage] = entry
+                    checkpoint['last_stage'] = stage
         except Exception as e:
             logger.warning(f"Failed to load checkpoint: {e}")
             return {}
 
+        return checkpoint
+
     def cleanup(self):
         """Cleanup resources"""
         # Future: implement cleanup logic
@@ -5,6 +5,7 @@ Handles parsing research papers (PDFs, arXiv links) and extracting metadata
 
 import re
 import urllib.parse
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 import logging
@@ -26,10 +27,15 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+ARXIV_NS = '{http://arxiv.org/schemas/atom}'
+
 
 class PaperIngestion:
     """Extract metadata and links from research papers"""
 
+    ARXIV_API_URL = 'https://export.arxiv.org/api/query'
+
     def __init__(self):
         self.github_pattern = re.compile(
             r'https?://(?:www\.)?github\.com/[\w\-\.]+/[\w\-\.]+'
@@ -137,6 +143,69 @@ class PaperIngestion:
 
         return metadata
 
+    def extract_metadata_only(self, arxiv_id: str) -> Dict:
+        """
+        Fetch arXiv metadata with a single request to the export API
+
+        Lighter than extract_from_arxiv: it needs neither the arxiv package
+        nor its client, and returns the same metadata dict.
+
+        Args:
+            arxiv_id: arXiv identifier, optionally prefixed or as an arXiv URL
+
+        Returns:
+            Paper metadata dict
+        """
+        # Clean arxiv ID
+        match = self.arxiv_pattern.search(arxiv_id)
+        if match:
+            arxiv_id = match.group(1)
+
+        metadata = {
+            'source': f'arXiv:{arxiv_id}',
+            'title': None,
+            'authors': [],
+            'abstract': None,
+            'github_urls': [],
+            'arxiv_id': arxiv_id,
+            'full_text': '',
+            'pdf_url': None,
+        }
+
+        try:
+            response = requests.get(self.ARXIV_API_URL, params={'id_list': arxiv_id}, timeout=10)
+            response.raise_for_status()
+
+            entry = ET.fromstring(response.content).find(f'{ATOM_NS}entry')
+            if entry is None or 'api/errors' in entry.findtext(f'{ATOM_NS}id', ''):
+                raise ValueError(f"arXiv paper not found: {arxiv_id}")
+
+            title = ' '.join(entry.findtext(f'{ATOM_NS}title', '').split())
+            summary = entry.findtext(f'{ATOM_NS}summary', '').strip()
+            comment = entry.findtext(f'{ARXIV_NS}comment', '')
+
+            metadata['title'] = title
+            metadata['authors'] = [
+                author.findtext(f'{ATOM_NS}name', '') for author in entry.iter(f'{ATOM_NS}author')
+            ]
+            metadata['abstract'] = summary
+
+            for link in entry.iter(f'{ATOM_NS}link'):
+                if link.get('title') == 'pdf':
+                    metadata['pdf_url'] = link.get('href')
+                    break
+
+            # Extract GitHub URLs from abstract and comments
+            full_text = f"{title}\n{summary}\n{comment}"
+            metadata['github_urls'] = self._extract_github_urls(full_text)
+            metadata['full_text'] = full_text
+
+        except Exception as e:
+            logger.error(f"Failed to fetch arXiv metadata for {arxiv_id}: {e}")
+            raise
+
+        return metadata
+
     def extract_from_url(self, url: str) -> Dict:
         """Extract paper information from a URL (arXiv, OpenReview, etc.)"""
         if 'arxiv.org' in url:
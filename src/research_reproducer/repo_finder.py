@@ -4,8 +4,11 @@ Finds GitHub repositories associated with research papers using multiple sources
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from .retry_utils import retry_with_backoff, RetryableError
 
@@ -15,6 +18,9 @@ logger = logging.getLogger(__name__)
 class RepositoryFinder:
     """Find GitHub repositories associated with research papers"""
 
+    # Worker threads for running independent search strategies concurrently
+    MAX_WORKERS = 8
+
     def __init__(self, github_token: Optional[str] = None):
         """
         Args:
@@ -25,6 +31,40 @@ class RepositoryFinder:
         if github_token:
             self.headers['Authorization'] = f'token {github_token}'
 
+        # One connection pool shared by per-thread sessions, so repeated GitHub /
+        # Papers with Code calls reuse connections without sharing a Session
+        # (which requests does not guarantee is thread-safe) across workers
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._local = threading.local()
+
+        # Created on first use and reused by every find_repositories call
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # GitHub API responses keyed by 'owner/repo', so the same repository
+        # found through several strategies is only fetched once
+        self._repo_info_cache = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the current thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+        return session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool, creating it on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_WORKERS, thread_name_prefix='repo-finder'
+                )
+            return self._executor
+
     def find_repositories(
         self,
         paper_metadata: Dict,
@@ -42,25 +82,36 @@ class RepositoryFinder:
         Returns:
             List of repository info dicts with keys: url, stars, description, source
         """
-        repos = []
-
         # Strategy 1: Use URLs already extracted from paper
-        if paper_metadata.get('github_urls'):
-            for url in paper_metadata['github_urls']:
-                repo_info = self._get_repo_info(url)
-                if repo_info:
-                    repo_info['source'] = 'paper_text'
-                    repos.append(repo_info)
-
         # Strategy 2: Search Papers with Code
+        # Strategy 3: Search by arXiv ID
+        tasks = [(self._get_repo_info, url) for url in paper_metadata.get('github_urls') or []]
+        n_url_tasks = len(tasks)
+
         if use_papers_with_code and paper_metadata.get('title'):
-            pwc_repos = self._search_papers_with_code(paper_metadata['title'])
-            repos.extend(pwc_repos)
+            tasks.append((self._search_papers_with_code, paper_metadata['title']))
 
-        # Strategy 3: Search by arXiv ID
         if paper_metadata.get('arxiv_id'):
-            arxiv_repos = self._search_by_arxiv_id(paper_metadata['arxiv_id'])
-            repos.extend(arxiv_repos)
+            tasks.append((self._search_by_arxiv_id, paper_metadata['arxiv_id']))
+
+        # The strategies are independent network lookups, so run them
+        # concurrently when there is more than one
+        if len(tasks) > 1:
+            executor = self._get_executor()
+            futures = [executor.submit(fn, arg) for fn, arg in tasks]
+            results = [future.result() for future in futures]
+        else:
+            results = [fn(arg) for fn, arg in tasks]
+
+        # Collect in strategy order so deduplication keeps the same preference
+        repos = []
+        for repo_info in results[:n_url_tasks]:
+            if repo_info:
+                repo_info['source'] = 'paper_text'
+                repos.append(repo_info)
+
+        for found in results[n_url_tasks:]:
+            repos.extend(found)
 
         # Deduplicate by URL
         unique_repos = {}
@@ -90,12 +141,16 @@ class RepositoryFinder:
             owner, repo = parts[-2], parts[-1]
             repo = repo.replace('.git', '')
 
+            cache_key = f'{owner}/{repo}'.lower()
+            if cache_key in self._repo_info_cache:
+                return {**self._repo_info_cache[cache_key], 'url': github_url}
+
             api_url = f'https://api.github.com/repos/{owner}/{repo}'
-            response = requests.get(api_url, headers=self.headers, timeout=10)
+            response = self.session.get(api_url, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
-                return {
+                repo_info = {
                     'url': github_url,
                     'full_name': data['full_name'],
                     'description': data.get('description', ''),
@@ -106,6 +161,8 @@ class RepositoryFinder:
                     'archived': data.get('archived', False),
                     'last_updated': data.get('updated_at', ''),
                 }
+                self._repo_info_cache[cache_key] = repo_info
+                return dict(repo_info)
             elif response.status_code == 404:
                 logger.warning(f"Repository not found: {github_url}")
             else:
@@ -126,7 +183,7 @@ class RepositoryFinder:
             search_url = 'https://paperswithcode.com/api/v1/papers/'
             params = {'q': title}
 
-            response = requests.get(search_url, params=params, timeout=10)
+            response = self.session.get(search_url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -137,7 +194,7 @@ class RepositoryFinder:
                     if paper_id:
                         # Get repositories for this paper
                         repo_url = f'https://paperswithcode.com/api/v1/papers/{paper_id}/repositories/'
-                        repo_response = requests.get(repo_url, timeout=10)
+                        repo_response = self.session.get(repo_url, timeout=10)
 
                         if repo_response.status_code == 200:
                             repo_data = repo_response.json()
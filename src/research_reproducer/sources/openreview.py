@@ -18,6 +18,7 @@ class OpenReviewSource:
 
     def __init__(self):
         self.headers = {'Content-Type': 'application/json'}
+        self.session = requests.Session()
 
     @retry_with_backoff(max_attempts=3, base_delay=2.0)
     def get_paper_by_id(self, paper_id: str) -> Optional[Dict]:
@@ -34,7 +35,7 @@ class OpenReviewSource:
             url = f'{self.BASE_URL}/notes'
             params = {'id': paper_id}
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -72,7 +73,7 @@ class OpenReviewSource:
             if venue:
                 params['invitation'] = f'{venue}/Conference/-/Blind_Submission'
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -116,7 +117,7 @@ class OpenReviewSource:
             url = f'{self.BASE_URL}/notes'
             params = {'forum': paper_id}
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -25,6 +25,7 @@ class SemanticScholarSource:
         self.headers = {}
         if api_key:
             self.headers['x-api-key'] = api_key
+        self.session = requests.Session()
 
     @retry_with_backoff(max_attempts=3, base_delay=2.0, exceptions=(requests.exceptions.RequestException,))
     def get_paper_by_arxiv(self, arxiv_id: str) -> Optional[Dict]:
@@ -43,7 +44,7 @@ class SemanticScholarSource:
                 'fields': 'title,authors,abstract,year,citationCount,referenceCount,publicationDate,externalIds,openAccessPdf,repository'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -78,7 +79,7 @@ class SemanticScholarSource:
                 'fields': 'title,authors,abstract,year,citationCount,externalIds,openAccessPdf,repository'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -109,7 +110,7 @@ class SemanticScholarSource:
                 'fields': 'title,authors,year,externalIds,repository'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -140,7 +141,7 @@ class SemanticScholarSource:
                 'fields': 'title,authors,year,externalIds,repository'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
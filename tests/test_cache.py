@@ -0,0 +1,110 @@
+"""
+Test suite for cache module
+"""
+
+import os
+import time
+
+import pytest
+from research_reproducer.cache import CACHE_SUFFIX, ReproducerCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory"""
+    return ReproducerCache(cache_dir=str(tmp_path / 'cache'))
+
+
+class TestReproducerCache:
+
+    def test_cache_key_is_stable(self, cache):
+        """Test that the same identifier always maps to the same key"""
+        key = cache._get_cache_key('2301.12345')
+
+        assert key == cache._get_cache_key('2301.12345')
+        assert key != cache._get_cache_key('2301.12346')
+
+    def test_paper_metadata_roundtrip(self, cache):
+        """Test caching and reading back paper metadata"""
+        metadata = {'title': 'Attention Is All You Need', 'authors': ['Vaswani']}
+        cache.set_paper_metadata('1706.03762', metadata)
+
+        assert cache.get_paper_metadata('1706.03762') == metadata
+        assert cache.get_paper_metadata('0000.00000') is None
+
+    def test_expired_entry_is_ignored(self, cache):
+        """Test that entries older than max age are treated as misses"""
+        cache.set_analysis('https://github.com/user/repo', {'languages': ['Python']})
+        cache_file = cache.analysis_cache_dir / f"{cache._get_cache_key('https://github.com/user/repo')}{CACHE_SUFFIX}"
+
+        old = time.time() - 4 * 86400
+        os.utime(cache_file, (old, old))
+
+        fresh_cache = ReproducerCache(cache_dir=str(cache.cache_dir))
+        assert fresh_cache.get_analysis('https://github.com/user/repo') is None
+
+    def test_cache_stats_track_writes_and_clears(self, cache):
+        """Test that cache stats follow set/clear operations"""
+        cache.set_paper_metadata('1706.03762', {'title': 'A'})
+        cache.set_paper_metadata('1706.03762', {'title': 'B'})
+        cache.set_repository_info('https://github.com/user/repo', {'stars': 1})
+
+        stats = cache.get_cache_stats()
+        assert stats['papers'] == 1
+        assert stats['repositories'] == 1
+        assert stats['analysis'] == 0
+
+        cache.clear_cache('papers')
+        assert cache.get_cache_stats()['papers'] == 0
+        assert cache.get_cache_stats()['repositories'] == 1
+
+    def test_memory_layer_serves_repeat_lookups(self, cache):
+        """Test that repeated lookups are served from memory"""
+        cache.set_paper_metadata('1706.03762', {'title': 'A'})
+        cache._clear_entries(cache.paper_cache_dir)
+
+        assert cache.get_paper_metadata('1706.03762') == {'title': 'A'}
+
+    def test_memory_layer_returns_copies(self, cache):
+        """Test that modifying stored or returned values does not change the cache"""
+        metadata = {'title': 'A', 'authors': ['Vaswani']}
+        cache.set_paper_metadata('1706.03762', metadata)
+        metadata['authors'].append('Shazeer')
+
+        cached = cache.get_paper_metadata('1706.03762')
+        cached['title'] = 'B'
+
+        assert cache.get_paper_metadata('1706.03762') == {'title': 'A', 'authors': ['Vaswani']}
+
+    def test_get_many_returns_only_hits(self, cache):
+        """Test bulk lookup of paper metadata"""
+        cache.set_paper_metadata('1706.03762', {'title': 'A'})
+        cache.set_paper_metadata('1810.04805', {'title': 'B'})
+
+        results = cache.get_many_paper_metadata(['1706.03762', '1810.04805', '0000.00000'])
+
+        assert results == {'1706.03762': {'title': 'A'}, '1810.04805': {'title': 'B'}}
+
+    def test_legacy_json_entry_is_read(self, cache):
+        """Test that plain JSON entries from older versions are still read"""
+        cache_key = cache._get_cache_key('1706.03762')
+        legacy_file = cache.paper_cache_dir / f"{cache_key}.json"
+        legacy_file.write_text('{"paper_id": "1706.03762", "metadata": {"title": "A"}}')
+
+        fresh_cache = ReproducerCache(cache_dir=str(cache.cache_dir))
+
+        assert fresh_cache.get_paper_metadata('1706.03762') == {'title': 'A'}
+        assert fresh_cache.get_cache_stats()['papers'] == 1
+
+    def test_large_entry_roundtrip(self, cache):
+        """Test that entries above the mmap threshold are read correctly"""
+        analysis = {'files': [f'src/module_{i}.py' for i in range(20000)]}
+        cache.set_analysis('https://github.com/user/big', analysis)
+
+        fresh_cache = ReproducerCache(cache_dir=str(cache.cache_dir))
+
+        assert fresh_cache.get_analysis('https://github.com/user/big') == analysis
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
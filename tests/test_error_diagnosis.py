@@ -0,0 +1,112 @@
+"""
+Test suite for error diagnosis module
+"""
+
+import re
+
+import pytest
+from research_reproducer import error_diagnosis
+from research_reproducer.error_diagnosis import ErrorDiagnoser
+from research_reproducer.executor import ExecutionResult
+
+
+class FakeHyperscan:
+    """Stand-in for hyperscan that finds matches with re and reports them by end offset"""
+
+    HS_FLAG_CASELESS = HS_FLAG_SINGLEMATCH = HS_FLAG_UTF8 = HS_FLAG_UCP = 0
+
+    class error(Exception):
+        pass
+
+    class ScanTerminated(Exception):
+        pass
+
+    class Scratch:
+        def __init__(self, db):
+            pass
+
+    class Database:
+        def compile(self, expressions, ids, flags):
+            self.patterns = [(i, re.compile(e.decode(), re.IGNORECASE)) for e, i in zip(expressions, ids)]
+
+        def scan(self, data, match_event_handler, scratch):
+            text = data.decode()
+            found = [(pattern.search(text), i) for i, pattern in self.patterns]
+            for end, i in sorted((match.end(), i) for match, i in found if match):
+                if match_event_handler(i, 0, end, 0, None):
+                    raise FakeHyperscan.ScanTerminated()
+
+
+class TestErrorDiagnoser:
+
+    def setup_method(self):
+        self.diagnoser = ErrorDiagnoser()
+
+    def test_missing_module(self):
+        """Test diagnosing a missing module with its name as root cause"""
+        diagnosis = self.diagnoser.diagnose("ModuleNotFoundError: No module named 'torch'")
+
+        assert diagnosis['error_type'] == 'ModuleNotFoundError'
+        assert diagnosis['category'] == 'dependency'
+        assert diagnosis['root_cause'] == 'torch'
+        assert "Install the missing package: pip install torch" in diagnosis['suggested_fixes']
+
+    def test_pattern_priority_beats_text_position(self):
+        """Test that a higher-ranked pattern wins even if it appears later"""
+        stderr = "TypeError: bad argument\nModuleNotFoundError: No module named 'numpy'"
+        diagnosis = self.diagnoser.diagnose(stderr)
+
+        assert diagnosis['error_type'] == 'ModuleNotFoundError'
+        assert diagnosis['root_cause'] == 'numpy'
+
+    def test_context_fixes_do_not_leak_between_calls(self):
+        """Test that context-specific fixes are not shared by repeat diagnoses"""
+        message = "CUDA error: no kernel image is available"
+        with_context = self.diagnoser.diagnose(message, {'gpu_available': False})
+        without_context = self.diagnoser.diagnose(message)
+
+        assert len(with_context['suggested_fixes']) == len(without_context['suggested_fixes']) + 1
+        assert self.diagnoser.error_patterns['CUDA_ERROR']['fixes'] == without_context['suggested_fixes']
+
+    def test_unknown_error(self):
+        """Test that unmatched text is reported as unknown"""
+        diagnosis = self.diagnoser.diagnose("Segmentation fault")
+
+        assert diagnosis['error_type'] == 'unknown'
+        assert diagnosis['matched_pattern'] is False
+
+    def test_analyze_execution_result_object_and_dict(self):
+        """Test that an ExecutionResult and its dict give the same analysis"""
+        result = ExecutionResult()
+        result.exit_code = 1
+        result.stderr = "ModuleNotFoundError: No module named 'torch'"
+        result.errors = ["ModuleNotFoundError: No module named 'torch'"]
+
+        analysis = self.diagnoser.analyze_execution_result(result)
+
+        assert analysis == self.diagnoser.analyze_execution_result(result.to_dict())
+        assert analysis['errors'][0]['root_cause'] == 'torch'
+
+    def test_hyperscan_backend_ranks_like_re(self, monkeypatch):
+        """Test that the Hyperscan path picks the same pattern as the combined regex"""
+        monkeypatch.setattr(error_diagnosis, 'hyperscan', None)
+        re_diagnoser = ErrorDiagnoser()
+        monkeypatch.setattr(error_diagnosis, 'hyperscan', FakeHyperscan())
+        hs_diagnoser = ErrorDiagnoser()
+        assert re_diagnoser._hs_db is None and hs_diagnoser._hs_db is not None
+
+        messages = [
+            "ModuleNotFoundError: No module named 'torch'",
+            "TypeError: bad argument\nModuleNotFoundError: No module named 'numpy'",
+            "CUDA error: no kernel image is available",
+            "RuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB",
+            "FileNotFoundError: [Errno 2] No such file or directory: 'data/train.csv'",
+            "KeyError: 'learning_rate'",
+            "Segmentation fault",
+        ]
+        for message in messages:
+            assert hs_diagnoser.diagnose(message) == re_diagnoser.diagnose(message)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,50 @@
+"""
+Test suite for code execution engine
+"""
+
+import pytest
+from research_reproducer.executor import CodeExecutor
+
+
+@pytest.fixture
+def executor(tmp_path):
+    """Create an executor for an empty repository"""
+    repo_path = tmp_path / 'repo'
+    repo_path.mkdir()
+    return CodeExecutor(repo_path, {}, tmp_path / 'logs')
+
+
+class TestCodeExecutor:
+
+    def test_successful_command(self, executor):
+        """Test that a plain command runs directly and captures its output"""
+        result = executor.execute('echo hello')
+
+        assert result.success
+        assert result.exit_code == 0
+        assert result.stdout.strip() == 'hello'
+
+    @pytest.mark.parametrize('stream_output', [True, False])
+    def test_missing_command_reports_shell_status(self, executor, stream_output):
+        """Test that a missing program gives exit 127 and 'command not found' like a shell"""
+        result = executor.execute('no-such-command-xyz --flag', stream_output=stream_output)
+
+        assert not result.success
+        assert result.exit_code == 127
+        assert result.stderr == 'no-such-command-xyz: command not found\n'
+        assert not any(error.startswith('Execution failed') for error in result.errors)
+
+    def test_runs_in_the_same_second_keep_separate_logs(self, executor):
+        """Test that back-to-back runs do not overwrite each other's log"""
+        first = executor.execute('echo first')
+        second = executor.execute('echo second')
+
+        assert first.log_file != second.log_file
+        with open(first.log_file) as f:
+            assert 'first' in f.read()
+        with open(second.log_file) as f:
+            assert 'second' in f.read()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
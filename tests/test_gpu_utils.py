@@ -0,0 +1,84 @@
+"""
+Test suite for GPU utilities
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from research_reproducer import gpu_utils
+
+
+class FakeNVML:
+    """Stand-in for pynvml reporting a single 16 GB GPU"""
+
+    NVMLError = RuntimeError
+
+    def nvmlDeviceGetCount(self):
+        return 1
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        return index
+
+    def nvmlDeviceGetName(self, handle):
+        return b'Tesla V100'
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        return SimpleNamespace(total=16384 << 20, free=12288 << 20)
+
+    def nvmlSystemGetCudaDriverVersion(self):
+        return 12020
+
+
+@pytest.fixture
+def nvml(monkeypatch):
+    """Route gpu_utils through a fake, already initialized NVML"""
+    monkeypatch.setattr(gpu_utils, 'pynvml', FakeNVML())
+    monkeypatch.setattr(gpu_utils, '_nvml_initialized', True)
+    monkeypatch.setattr(gpu_utils, '_gpu_cache', None)
+    gpu_utils._nvml_devices.cache_clear()
+    gpu_utils.get_cuda_version.cache_clear()
+    yield
+    gpu_utils._nvml_devices.cache_clear()
+    gpu_utils.get_cuda_version.cache_clear()
+
+
+class TestGPUUtils:
+
+    def test_detect_gpus_with_nvml(self, nvml):
+        """Test that NVML device info is converted to GPU dicts"""
+        assert gpu_utils.detect_gpus() == [{
+            'index': 0,
+            'name': 'Tesla V100',
+            'memory_total_mb': 16384,
+            'memory_free_mb': 12288,
+        }]
+
+    def test_detect_gpus_reuses_recent_result(self, nvml, monkeypatch):
+        """Test that GPU info is cached until the TTL expires"""
+        gpu_utils.detect_gpus()[0]['name'] = 'modified'
+        monkeypatch.setattr(gpu_utils.pynvml, 'nvmlDeviceGetCount', lambda: 0)
+        assert gpu_utils.detect_gpus()[0]['name'] == 'Tesla V100'
+
+        monkeypatch.setattr(gpu_utils, 'GPU_INFO_TTL', 0)
+        memory_info = gpu_utils.pynvml.nvmlDeviceGetMemoryInfo
+        monkeypatch.setattr(gpu_utils.pynvml, 'nvmlDeviceGetMemoryInfo',
+                            lambda handle: SimpleNamespace(total=memory_info(handle).total, free=0))
+        assert gpu_utils.detect_gpus()[0]['memory_free_mb'] == 0
+
+    def test_cuda_version_with_nvml(self, nvml):
+        """Test that the NVML driver version is formatted as major.minor"""
+        assert gpu_utils.get_cuda_version() == '12.2'
+
+    def test_recommend_batch_size_fits_free_memory(self, monkeypatch):
+        """Test that the recommended batch is the largest that fits"""
+        monkeypatch.setattr(gpu_utils, 'get_gpu_memory', lambda: {'total_mb': 16384, 'free_mb': 8000})
+
+        batch_size = gpu_utils.recommend_batch_size(110, max_batch_size=64)
+
+        assert gpu_utils.estimate_gpu_memory_needed(110, batch_size) <= 8000
+        assert gpu_utils.estimate_gpu_memory_needed(110, batch_size + 1) > 8000
+        assert gpu_utils.recommend_batch_size(110, max_batch_size=4) == 4
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,155 @@
+"""
+Test suite for reproducibility leaderboard
+"""
+
+import gc
+import json
+import weakref
+from datetime import datetime
+
+import pytest
+from research_reproducer.leaderboard import ReproducibilityLeaderboard
+
+
+def make_result(success: bool, execution_time: float = 0, complexity: str = None) -> dict:
+    """Build a minimal reproduction result"""
+    return {
+        'paper': {'title': 'Attention Is All You Need', 'authors': ['Vaswani']},
+        'success': success,
+        'execution': {'execution_time': execution_time},
+        'analysis': {'estimated_complexity': complexity},
+        'environment': {'type': 'venv'},
+    }
+
+
+@pytest.fixture
+def leaderboard(tmp_path):
+    """Create a leaderboard in a temporary directory"""
+    return ReproducibilityLeaderboard(db_path=str(tmp_path / 'leaderboard.json'))
+
+
+class TestReproducibilityLeaderboard:
+
+    def test_paper_and_global_stats(self, leaderboard):
+        """Test stats after several attempts"""
+        leaderboard.add_result('1706.03762', make_result(True, 10.0, 'low'))
+        leaderboard.add_result('1706.03762', make_result(False))
+        leaderboard.add_result('1810.04805', make_result(True, 4.0))
+
+        paper = leaderboard.get_paper_stats('1706.03762')
+        assert paper['success_rate'] == 50
+        assert paper['avg_time'] == 10.0
+
+        stats = leaderboard.get_global_stats()
+        assert stats['total_papers'] == 2
+        assert stats['total_attempts'] == 3
+        assert stats['successful_reproductions'] == 2
+        assert stats['avg_success_rate'] == 75
+        assert stats['highly_reproducible'] + stats['moderately_reproducible'] + stats['low_reproducible'] == 2
+        assert stats['low_reproducible'] == sum(
+            1 for p in leaderboard.data['papers'].values() if p['reproducibility_score'] < 50
+        )
+
+    def test_old_data_is_upgraded(self, leaderboard, tmp_path):
+        """Test that data saved without counters or float timestamps is upgraded"""
+        leaderboard.add_result('1706.03762', make_result(True, 10.0))
+        leaderboard.add_result('1706.03762', make_result(False, 5.0))
+        leaderboard.flush()
+
+        old_data = json.loads(leaderboard.db_path.read_text())
+        old_paper = old_data['papers']['1706.03762']
+        for key in ('n_attempts', 'n_success', 'sum_time', 'n_timed'):
+            del old_paper[key]
+        for attempt in old_paper['attempts']:
+            attempt['timestamp'] = datetime.fromtimestamp(attempt.pop('ts')).isoformat()
+        leaderboard.db_path.write_text(json.dumps(old_data))
+
+        reloaded = ReproducibilityLeaderboard(db_path=str(leaderboard.db_path))
+        reloaded.add_result('1706.03762', make_result(True))
+
+        paper = reloaded.get_paper_stats('1706.03762')
+        assert paper['n_attempts'] == 3
+        assert paper['avg_time'] == 7.5
+        assert all(isinstance(attempt['ts'], float) for attempt in paper['attempts'])
+        assert reloaded.get_global_stats()['successful_reproductions'] == 2
+
+    def test_top_papers_ranked_by_score(self, leaderboard):
+        """Test that top papers are ordered by score, ties by first appearance"""
+        leaderboard.add_result('a', make_result(False))
+        leaderboard.add_result('b', make_result(True, 1.0, 'low'))
+        leaderboard.add_result('c', make_result(False))
+        leaderboard.add_result('a', make_result(True))
+
+        top = leaderboard.get_top_papers()
+        scores = [paper['reproducibility_score'] for paper in top]
+
+        assert scores == sorted(scores, reverse=True)
+        assert [paper['paper_id'] for paper in top] == ['b', 'a', 'c']
+        assert [paper['paper_id'] for paper in leaderboard.get_top_papers(limit=1)] == ['b']
+
+    def test_unflushed_attempts_are_replayed(self, leaderboard):
+        """Test that attempts only in the append log survive a reload"""
+        leaderboard.add_result('1706.03762', make_result(True, 10.0))
+        leaderboard.add_result('1810.04805', make_result(False))
+
+        assert not leaderboard.db_path.exists()
+
+        reloaded = ReproducibilityLeaderboard(db_path=str(leaderboard.db_path))
+        assert reloaded.get_global_stats() == leaderboard.get_global_stats()
+        assert reloaded.get_paper_stats('1706.03762')['title'] == 'Attention Is All You Need'
+
+        reloaded.flush()
+        assert reloaded.log_path.stat().st_size == 0
+        assert ReproducibilityLeaderboard(db_path=str(leaderboard.db_path)).data == reloaded.data
+
+    def test_instances_sharing_a_file_keep_each_others_attempts(self, leaderboard):
+        """Test that compacting one instance does not drop another's logged attempts"""
+        other = ReproducibilityLeaderboard(db_path=str(leaderboard.db_path))
+
+        leaderboard.add_result('1706.03762', make_result(True, 10.0))
+        other.add_result('1810.04805', make_result(False))
+        leaderboard.flush()
+        other.flush()
+
+        reloaded = ReproducibilityLeaderboard(db_path=str(leaderboard.db_path))
+        assert set(reloaded.data['papers']) == {'1706.03762', '1810.04805'}
+        assert reloaded.get_global_stats()['total_attempts'] == 2
+
+    def test_non_json_values_are_compacted(self, leaderboard, tmp_path):
+        """Test that a value the log accepts does not break exporting or flushing"""
+        result = make_result(True, 1.0)
+        result['environment']['type'] = tmp_path / 'venv'
+        leaderboard.add_result('1706.03762', result)
+        exported = json.loads(leaderboard.export_json())
+        leaderboard.flush()
+
+        assert exported['papers']['1706.03762']['attempts'][0]['environment'] == str(tmp_path / 'venv')
+        assert leaderboard.log_path.stat().st_size == 0
+        paper = json.loads(leaderboard.db_path.read_text())['papers']['1706.03762']
+        assert paper['attempts'][0]['environment'] == str(tmp_path / 'venv')
+
+    def test_corrupt_file_is_moved_aside(self, leaderboard, tmp_path):
+        """Test that an unreadable leaderboard is backed up rather than overwritten"""
+        leaderboard.db_path.write_text('{"papers": {')
+
+        reloaded = ReproducibilityLeaderboard(db_path=str(leaderboard.db_path))
+
+        assert reloaded.data['papers'] == {}
+        backups = list(tmp_path.glob('leaderboard.json.corrupt-*'))
+        assert len(backups) == 1
+        assert backups[0].read_text() == '{"papers": {'
+
+    @pytest.mark.filterwarnings('ignore::ResourceWarning')
+    def test_instances_can_be_freed(self, tmp_path):
+        """Test that the exit hook does not keep leaderboards alive"""
+        leaderboard = ReproducibilityLeaderboard(db_path=str(tmp_path / 'leaderboard.json'))
+        ref = weakref.ref(leaderboard)
+
+        del leaderboard
+        gc.collect()
+
+        assert ref() is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
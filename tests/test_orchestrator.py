@@ -0,0 +1,59 @@
+"""
+Test suite for reproduction orchestrator
+"""
+
+import json
+
+import pytest
+from research_reproducer.orchestrator import ReproductionOrchestrator
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    """Create an orchestrator without cache in a temporary directory"""
+    return ReproductionOrchestrator(work_dir=str(tmp_path / 'reproductions'), use_cache=False)
+
+
+class TestReproductionOrchestrator:
+
+    def test_reproduce_many_isolates_failed_papers(self, orchestrator, monkeypatch):
+        """Test that one failing lookup does not abort the rest of the batch"""
+        def extract_from_arxiv(arxiv_id):
+            if arxiv_id == 'bad':
+                raise ValueError('paper not found')
+            return {'title': f'Paper {arxiv_id}', 'arxiv_id': arxiv_id}
+
+        monkeypatch.setattr(orchestrator.paper_ingestion, 'extract_from_arxiv', extract_from_arxiv)
+        monkeypatch.setattr(orchestrator.repo_finder, 'find_repositories', lambda metadata: [])
+
+        reports = orchestrator.reproduce_many(['good', 'bad', 'other'], interactive=False)
+
+        assert [report['paper'].get('arxiv_id') for report in reports] == ['good', 'bad', 'other']
+        assert reports[1]['error'] == 'paper not found'
+        assert reports[0]['paper']['title'] == 'Paper good'
+        assert 'error' not in reports[0] and 'error' not in reports[2]
+        assert not any(report['success'] for report in reports)
+        assert reports[0] is not reports[2]
+
+    def test_large_output_keeps_tail_next_to_log_pointer(self, orchestrator, tmp_path):
+        """Test that a large capture is saved as a log pointer plus a bounded tail"""
+        limit = orchestrator.REPORT_INLINE_OUTPUT_BYTES
+        orchestrator.session_dir = tmp_path
+        orchestrator.report['execution'] = {
+            'log_file': str(tmp_path / 'execution.log'),
+            'stdout': 'x' * limit + 'last line\n',
+            'stderr': 'Traceback: boom\n',
+        }
+
+        orchestrator._save_report()
+
+        saved = json.loads((tmp_path / 'report.json').read_text())['execution']
+        assert saved['stdout']['log_file'] == str(tmp_path / 'execution.log')
+        assert saved['stdout']['tail'].endswith('last line\n')
+        assert len(saved['stdout']['tail']) == limit
+        assert saved['stderr'] == 'Traceback: boom\n'
+        assert len(orchestrator.report['execution']['stdout']) == limit + 10
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -43,6 +43,42 @@ class TestPaperIngestion:
 
         assert urls[0] == "https://github.com/user/repo"
 
+    def test_extract_metadata_only(self, monkeypatch):
+        """Test parsing metadata from the arXiv export API"""
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+          <entry>
+            <id>http://arxiv.org/abs/1706.03762v7</id>
+            <title>Attention Is All
+              You Need</title>
+            <summary>  The dominant sequence transduction models...  </summary>
+            <author><name>Ashish Vaswani</name></author>
+            <author><name>Noam Shazeer</name></author>
+            <arxiv:comment>Code at https://github.com/tensorflow/tensor2tensor</arxiv:comment>
+            <link title="pdf" href="http://arxiv.org/pdf/1706.03762v7" rel="related"/>
+          </entry>
+        </feed>"""
+
+        class Response:
+            content = feed
+
+            def raise_for_status(self):
+                pass
+
+        monkeypatch.setattr(
+            'research_reproducer.paper_ingestion.requests.get',
+            lambda *args, **kwargs: Response()
+        )
+
+        metadata = self.ingestion.extract_metadata_only("arXiv:1706.03762")
+
+        assert metadata['arxiv_id'] == "1706.03762"
+        assert metadata['title'] == "Attention Is All You Need"
+        assert metadata['authors'] == ["Ashish Vaswani", "Noam Shazeer"]
+        assert metadata['abstract'] == "The dominant sequence transduction models..."
+        assert metadata['pdf_url'] == "http://arxiv.org/pdf/1706.03762v7"
+        assert metadata['github_urls'] == ["https://github.com/tensorflow/tensor2tensor"]
+
     @pytest.mark.integration
     def test_arxiv_fetch(self):
         """Test fetching from arXiv (integration test)"""